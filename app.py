@@ -4,15 +4,80 @@ Modern GUI application with proper MVC architecture
 Enhanced with comprehensive error handling
 """
 
-import threading
+import asyncio
 import logging
+import multiprocessing
+import queue
+import sys
 import traceback
-from typing import List, Dict
-from models.outlook_model import OutlookModel, OutlookConnectionError, OutlookDataError
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from operator import attrgetter
+from typing import Dict, List, Optional
+from models.outlook_model import (
+    OutlookModel, OutlookConnectionError, OutlookDataError,
+    connect_worker, fetch_conversations, fetch_folder_conversations, fetch_read_states, init_fetch_worker,
+    FOLDER_INBOX, FOLDER_SENT, FOLDER_DELETED, FOLDER_NAMES, PAGE_SIZE
+)
+from models.records import Conversation
+from models.search_index import ConversationSearchIndex
 from views.main_window import MainWindow
 
 logger = logging.getLogger(__name__)
 
+LOG_FILE = 'outlook_reader.log'
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Interval between asyncio loop iterations driven from Tk
+ASYNCIO_PUMP_MS = 10
+
+# Folders read in the background after the first Inbox load, so switching
+# to them is instant, and how many of their most recent emails to read
+PREFETCH_FOLDERS = (FOLDER_SENT, FOLDER_DELETED)
+PREFETCH_LIMIT = 100
+
+
+def configure_logging(level: int = logging.INFO, to_console: bool = False) -> QueueListener:
+    """
+    Route log records through a queue to the log file (and optionally the console).
+    Callers only enqueue records; a listener thread does the file I/O.
+    Returns the started listener, to be stopped on exit.
+    """
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.FileHandler(LOG_FILE)]
+    if to_console:
+        handlers.append(logging.StreamHandler())
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def _init_fetch_process(level: int, log_queue, status_queue):
+    """
+    Initialize logging and COM in the fetch worker process.
+    Log records are sent to the GUI process, whose listener is the only
+    writer of the log file.
+    """
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.handlers = [QueueHandler(log_queue)]
+
+    # Importing pythoncom initializes COM on the importing thread with
+    # sys.coinit_flags (apartment-threaded by default), so the multithreaded
+    # apartment must be requested before pywin32 is first imported
+    sys.coinit_flags = 0  # COINIT_MULTITHREADED
+    init_fetch_worker(status_queue)
+
 
 class OutlookInboxApp:
     """Main application controller - coordinates Model and View"""
@@ -28,13 +93,55 @@ class OutlookInboxApp:
             self.model = OutlookModel()
             self.view = MainWindow()
 
-            # Store current conversations
-            self.current_conversations: List[Dict] = []
+            # Event loop for background work, driven from the Tk event loop so
+            # coroutines resume on the GUI thread
+            self.loop = asyncio.new_event_loop()
+            self._tasks = set()
+            self.view.after(ASYNCIO_PUMP_MS, self._pump_asyncio)
+
+            # Worker process that holds the Outlook connection and reads
+            # conversations; it reports progress through a queue the view polls
+            self._status_queue = multiprocessing.Queue()
+            self.view.watch_status_queue(self._status_queue)
+
+            # Log records from the worker process are handed to this process's
+            # log handlers (see configure_logging)
+            self._worker_log_queue = multiprocessing.Queue()
+            self._worker_log_listener = QueueListener(
+                self._worker_log_queue, *logging.getLogger().handlers
+            )
+            self._worker_log_listener.start()
+            self._fetch_executor = self._create_fetch_executor()
+            # Whether the worker process connected to Outlook (see _connect)
+            self._connected = False
+
+            # Store current conversations (and the index used to search them)
+            self.current_conversations: List[Conversation] = []
+            self._search_index = ConversationSearchIndex([])
+            # Received time of the oldest loaded email ("Load older" starts there)
+            self._oldest_loaded_time: Optional[datetime] = None
+            # Whether the newest page was read in full since connecting; until
+            # then a refresh is a full load, so mail deleted, moved or read
+            # elsewhere (e.g. since the cached session) is picked up
+            self._full_sync_done = False
+
+            # Folder shown in the view, and conversations read from the other folders
+            self._current_folder = FOLDER_INBOX
+            self._folder_cache: Dict[int, List[Conversation]] = {}
+            self._prefetch_started = False
+            # Inbox and folder loads still running (see _set_loading)
+            self._loads_in_flight = 0
 
             # Setup view callbacks
             logger.info("Setting up view callbacks...")
             self.view.on_refresh_callback = self.refresh_conversations
             self.view.on_search_callback = self.search_conversations
+            self.view.on_load_older_callback = self.load_older_conversations
+            self.view.on_folder_callback = self.switch_folder
+            self.view.set_folders(list(FOLDER_NAMES.values()), FOLDER_NAMES[FOLDER_INBOX])
+
+            # Show conversations cached by the previous session while connecting
+            self._show_cached_conversations()
 
             # Auto-connect on startup
             logger.info("Scheduling auto-connect...")
@@ -47,6 +154,25 @@ class OutlookInboxApp:
             logger.debug(f"Initialization error traceback: {traceback.format_exc()}")
             raise
 
+    def _show_cached_conversations(self):
+        """Display conversations from the local cache, if any"""
+        try:
+            conversations = self.model.load_cached_conversations()
+            if not conversations:
+                logger.info("No cached conversations")
+                return
+
+            self._set_conversations(conversations)
+            self._show_conversations(conversations)
+            total_emails = sum(conv.count for conv in conversations)
+            self.view.update_stats(total_emails, len(conversations))
+            self.view.set_status(f"Showing {len(conversations)} cached conversation(s)")
+            logger.info(f"Displayed {len(conversations)} cached conversations")
+
+        except Exception as e:
+            logger.error(f"Error showing cached conversations: {e}")
+            logger.debug(f"Cache display error traceback: {traceback.format_exc()}")
+
     def auto_connect(self):
         """Automatically connect to Outlook on startup"""
         logger.info("Auto-connect initiated")
@@ -54,23 +180,8 @@ class OutlookInboxApp:
         try:
             self.view.set_status("Connecting to Outlook...")
 
-            def connect_thread():
-                try:
-                    logger.info("Connection thread started")
-                    success, message = self.model.connect()
-                    logger.info(f"Connection result: success={success}, message='{message}'")
-
-                    # Update UI on main thread
-                    self.view.after(0, lambda: self._on_connect_complete(success, message))
-
-                except Exception as e:
-                    logger.error(f"Error in connection thread: {e}")
-                    logger.debug(f"Connection thread error traceback: {traceback.format_exc()}")
-                    self.view.after(0, lambda: self._on_connect_complete(False, f"Connection failed: {str(e)}"))
-
-            thread = threading.Thread(target=connect_thread, daemon=True)
-            thread.start()
-            logger.info("Connection thread launched")
+            self._spawn(self._connect())
+            logger.info("Connection task scheduled")
 
         except Exception as e:
             logger.error(f"Error starting auto-connect: {e}")
@@ -80,12 +191,33 @@ class OutlookInboxApp:
                 f"Failed to start connection process:\n{str(e)}"
             )
 
+    async def _connect(self):
+        """Connect to Outlook in the worker process and report the result"""
+        try:
+            logger.info("Connection task started")
+            success, message = await self.loop.run_in_executor(self._fetch_executor, connect_worker)
+            logger.info(f"Connection result: success={success}, message='{message}'")
+
+        except BrokenProcessPool as e:
+            logger.error(f"Fetch worker process died: {e}")
+            self._fetch_executor = self._create_fetch_executor()
+            success, message = False, "The Outlook reader process stopped unexpectedly."
+
+        except Exception as e:
+            logger.error(f"Error in connection task: {e}")
+            logger.debug(f"Connection task error traceback: {traceback.format_exc()}")
+            success, message = False, f"Connection failed: {str(e)}"
+
+        self._on_connect_complete(success, message)
+
     def _on_connect_complete(self, success: bool, message: str):
         """Handle connection completion"""
         logger.info(f"Connection complete: success={success}")
+        self._connected = success
 
         try:
             if success:
+                self._full_sync_done = False
                 self.view.set_status("Connected to Outlook - Click refresh to load emails")
                 logger.info("Auto-loading conversations...")
                 # Auto-refresh on successful connection
@@ -111,7 +243,7 @@ class OutlookInboxApp:
         logger.info("Refresh conversations requested")
 
         try:
-            if not self.model.is_connected():
+            if not self._connected:
                 logger.error("Cannot refresh - not connected to Outlook")
                 self.view.show_error(
                     "Not Connected",
@@ -119,100 +251,465 @@ class OutlookInboxApp:
                 )
                 return
 
-            logger.info("Starting conversation refresh...")
-            self.view.set_loading(True)
-            self.view.clear_search()
-
-            def load_thread():
-                try:
-                    logger.info("Load thread started")
-                    conversations = self.model.get_conversations()
-
-                    logger.info(f"Load thread completed: {len(conversations) if conversations else 0} conversations")
-
-                    # Update UI on main thread
-                    self.view.after(0, lambda: self._on_conversations_loaded(conversations))
+            if self._current_folder != FOLDER_INBOX:
+                self._set_loading(True)
+                self.view.clear_search()
+                self._spawn(self._load_folder(self._current_folder))
+                logger.info("Folder load task scheduled")
+                return
 
-                except OutlookDataError as e:
-                    logger.error(f"OutlookDataError in load thread: {e}")
-                    self.view.after(0, lambda: self._on_load_error(str(e)))
+            # Only read emails newer than the last load once a full load was done
+            since = self.model.get_last_sync() if self._full_sync_done else None
+            is_delta = since is not None
 
-                except Exception as e:
-                    logger.error(f"Unexpected error in load thread: {e}")
-                    logger.debug(f"Load thread error traceback: {traceback.format_exc()}")
-                    self.view.after(0, lambda: self._on_load_error(f"Unexpected error: {str(e)}"))
+            logger.info(f"Starting conversation refresh ({'incremental' if is_delta else 'full'})...")
+            self._set_loading(True)
+            self.view.clear_search()
 
-            thread = threading.Thread(target=load_thread, daemon=True)
-            thread.start()
-            logger.info("Load thread launched")
+            self._spawn(self._load_conversations(since))
+            logger.info("Load task scheduled")
 
         except Exception as e:
             logger.error(f"Error starting refresh: {e}")
             logger.debug(f"Refresh error traceback: {traceback.format_exc()}")
-            self.view.set_loading(False)
+            self._set_loading(False)
             self.view.set_status("Error starting refresh")
             self.view.show_error(
                 "Refresh Error",
                 f"Failed to start refresh:\n{str(e)}\n\nCheck outlook_reader.log for details."
             )
 
-    def _on_conversations_loaded(self, conversations: List[Dict]):
-        """Handle successful conversation loading"""
-        logger.info(f"Processing loaded conversations: {len(conversations) if conversations else 0} items")
+    def load_older_conversations(self):
+        """Load the page of conversations received before the oldest loaded email"""
+        logger.info("Load older conversations requested")
 
         try:
-            # Validate conversations
-            if conversations is None:
-                logger.warning("Received None for conversations, using empty list")
-                conversations = []
+            if not self._connected:
+                logger.error("Cannot load older conversations - not connected to Outlook")
+                self.view.show_error(
+                    "Not Connected",
+                    "Not connected to Outlook. Please restart the application."
+                )
+                return
+
+            if self._current_folder != FOLDER_INBOX:
+                self.view.set_status("Older emails can only be loaded in the Inbox")
+                return
+
+            if self._oldest_loaded_time is None:
+                logger.info("Nothing loaded yet - doing a full refresh instead")
+                self.refresh_conversations()
+                return
+
+            logger.info(f"Loading conversations before {self._oldest_loaded_time}...")
+            self._set_loading(True)
+            self.view.clear_search()
+
+            self._spawn(self._load_conversations(before=self._oldest_loaded_time))
+            logger.info("Load task scheduled")
+
+        except Exception as e:
+            logger.error(f"Error starting load of older conversations: {e}")
+            logger.debug(f"Load older error traceback: {traceback.format_exc()}")
+            self._set_loading(False)
+            self.view.set_status("Error loading older conversations")
+
+    async def _load_conversations(self, since: Optional[datetime] = None,
+                                  before: Optional[datetime] = None):
+        """Fetch conversations in the worker process and hand them to the view"""
+        is_delta = since is not None
+        is_older = before is not None
+
+        try:
+            logger.info("Load task started")
+            # Outlook is read in a separate process so COM marshalling never holds
+            # the GUI process's GIL
+            conversations = await self.loop.run_in_executor(
+                self._fetch_executor, fetch_conversations, since, before
+            )
+            logger.info(f"Load task completed: {len(conversations) if conversations else 0} conversations")
+
+            # An incremental read only sees new mail; read states of the loaded
+            # window show what was read, deleted or moved since
+            read_states = None
+            if is_delta and self._oldest_loaded_time is not None:
+                try:
+                    read_states = await self.loop.run_in_executor(
+                        self._fetch_executor, fetch_read_states, self._oldest_loaded_time
+                    )
+                except (OutlookDataError, OutlookConnectionError) as e:
+                    logger.warning(f"Could not sync read states: {e}")
+
+        except (OutlookDataError, OutlookConnectionError) as e:
+            logger.error(f"{type(e).__name__} in fetch worker: {e}")
+            self._on_load_error(str(e))
+            return
+
+        except BrokenProcessPool as e:
+            logger.error(f"Fetch worker process died: {e}")
+            self._fetch_executor = self._create_fetch_executor()
+            self._on_load_error("The Outlook reader process stopped unexpectedly. Please try again.")
+            return
+
+        except Exception as e:
+            logger.error(f"Unexpected error in load task: {e}")
+            logger.debug(f"Load task error traceback: {traceback.format_exc()}")
+            self._on_load_error(f"Unexpected error: {str(e)}")
+            return
+
+        self._on_conversations_loaded(conversations, is_delta, is_older, read_states)
 
-            if not isinstance(conversations, list):
-                logger.error(f"Invalid conversations type: {type(conversations)}")
-                conversations = []
+    def switch_folder(self, folder_name: str):
+        """Show another folder, from the prefetched conversations when available"""
+        logger.info(f"Folder switch requested: '{folder_name}'")
+
+        try:
+            folder_id = next(fid for fid, name in FOLDER_NAMES.items() if name == folder_name)
+            if folder_id == self._current_folder:
+                return
+
+            self._current_folder = folder_id
+            self.view.clear_search()
+
+            if folder_id == FOLDER_INBOX:
+                self._show_folder(self.current_conversations)
+                return
+
+            cached = self._folder_cache.get(folder_id)
+            if cached is not None:
+                logger.info(f"Showing {len(cached)} prefetched conversations from {folder_name}")
+                self._show_folder(cached)
+                return
+
+            if not self._connected:
+                self._show_folder([])
+                self.view.set_status("Not connected to Outlook")
+                return
+
+            self._set_loading(True)
+            self._spawn(self._load_folder(folder_id))
+            logger.info("Folder load task scheduled")
+
+        except Exception as e:
+            logger.error(f"Error switching folder: {e}")
+            logger.debug(f"Folder switch error traceback: {traceback.format_exc()}")
+            self._set_loading(False)
+            self.view.set_status("Error switching folder")
+
+    def _show_folder(self, conversations: List[Conversation]):
+        """Display the conversations of the selected folder and index them for search"""
+        self._search_index = ConversationSearchIndex(conversations)
+        self._show_conversations(conversations)
+        total_emails = sum(conv.count for conv in conversations)
+        self.view.update_stats(total_emails, len(conversations))
+        self.view.set_status(
+            f"Showing {len(conversations)} conversation(s) from {FOLDER_NAMES[self._current_folder]}"
+        )
+
+    async def _load_folder(self, folder_id: int):
+        """Fetch a non-Inbox folder in the worker process and show it if still selected"""
+        try:
+            logger.info(f"Folder load task started: {FOLDER_NAMES[folder_id]}")
+            conversations = await self.loop.run_in_executor(
+                self._fetch_executor, fetch_folder_conversations, folder_id
+            )
+
+        except BrokenProcessPool as e:
+            logger.error(f"Fetch worker process died: {e}")
+            self._fetch_executor = self._create_fetch_executor()
+            self._on_folder_load_error(folder_id, "The Outlook reader process stopped unexpectedly. Please try again.")
+            return
+
+        except Exception as e:
+            logger.error(f"Error loading folder {FOLDER_NAMES[folder_id]}: {e}")
+            self._on_folder_load_error(folder_id, str(e))
+            return
+
+        # The load ends whether or not the user is still looking at the folder
+        self._set_loading(False)
+        self._folder_cache[folder_id] = conversations
+        if self._current_folder == folder_id:
+            self._show_folder(conversations)
+
+    def _on_folder_load_error(self, folder_id: int, error_message: str):
+        """End a failed folder load; the error is only shown if the folder is still selected"""
+        if self._current_folder == folder_id:
+            self._on_load_error(error_message)
+        else:
+            self._set_loading(False)
+
+    def _start_prefetch(self):
+        """Read the other folders in the background once, after the first Inbox load"""
+        if self._prefetch_started:
+            return
+        self._prefetch_started = True
+        self._spawn(self._prefetch_folders(PREFETCH_FOLDERS))
+
+    async def _prefetch_folders(self, folder_ids):
+        """Fetch folders the user is likely to open next into the folder cache"""
+        for folder_id in folder_ids:
+            if folder_id in self._folder_cache:
+                continue
+            try:
+                conversations = await self.loop.run_in_executor(
+                    self._fetch_executor, fetch_folder_conversations, folder_id, PREFETCH_LIMIT
+                )
+            except Exception as e:
+                # Not fatal - the folder is fetched when the user opens it
+                logger.warning(f"Prefetch of {FOLDER_NAMES[folder_id]} failed: {e}")
+                continue
+
+            # Keep a fuller copy loaded on demand while this one was in flight
+            self._folder_cache.setdefault(folder_id, conversations)
+            logger.info(f"Prefetched {len(conversations)} conversations from {FOLDER_NAMES[folder_id]}")
+
+    def _set_loading(self, is_loading: bool):
+        """
+        Start or end a load. Inbox and folder loads can overlap, so the view
+        shows the loading state until the last one in flight ends.
+        """
+        if is_loading:
+            self._loads_in_flight += 1
+        else:
+            self._loads_in_flight = max(0, self._loads_in_flight - 1)
+        if is_loading or self._loads_in_flight == 0:
+            self.view.set_loading(is_loading)
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """Schedule a coroutine on the application's event loop"""
+        task = self.loop.create_task(coro)
+        # The loop only keeps weak references to tasks
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _pump_asyncio(self):
+        """Run one iteration of the asyncio loop, then reschedule from Tk"""
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        self.view.after(ASYNCIO_PUMP_MS, self._pump_asyncio)
+
+    def _show_conversations(self, conversations: List[Conversation]):
+        """Display conversations (the view creates cards as they scroll into view)"""
+        self.view.display_conversations(conversations)
+
+    def _create_fetch_executor(self) -> ProcessPoolExecutor:
+        """Create the single worker process that reads conversations from Outlook"""
+        return ProcessPoolExecutor(
+            max_workers=1,
+            initializer=_init_fetch_process,
+            initargs=(logging.getLogger().getEffectiveLevel(), self._worker_log_queue, self._status_queue)
+        )
+
+    def _on_conversations_loaded(self, conversations: List[Conversation],
+                                 is_delta: bool = False, is_older: bool = False,
+                                 read_states: Optional[Dict[str, bool]] = None):
+        """
+        Handle successful conversation loading.
+        read_states (EntryID -> unread) accompany an incremental refresh and
+        cover every loaded email.
+        """
+        logger.info(f"Processing loaded conversations: {len(conversations)} items")
+
+        # The model guarantees a list of Conversation records; check once, in debug runs only
+        assert all(isinstance(conv, Conversation) for conv in conversations)
+
+        try:
+            # Emails were read by the worker process - record how far we got
+            self.model.update_last_sync(conversations)
+
+            if is_older and not conversations:
+                logger.info("No older conversations")
+                self._set_loading(False)
+                self.view.set_status("No older emails to load")
+                return
+
+            # A delta that filled a whole page may not reach back to what we
+            # have - it replaces the list rather than leaving a gap
+            if is_delta and sum(conv.count for conv in conversations) >= PAGE_SIZE:
+                logger.info("Incremental refresh returned a full page - replacing conversations")
+                is_delta = False
+
+            if not is_delta and not is_older:
+                self._full_sync_done = True
+
+            if is_delta and read_states is not None:
+                self._apply_read_states(read_states)
+
+            # Incremental refresh and older pages only return part of the inbox -
+            # merge them into what we have
+            if is_delta or is_older:
+                conversations = self._merge_conversations(conversations, older=is_older)
 
             # Store conversations
-            self.current_conversations = conversations
+            self._set_conversations(conversations)
             logger.info(f"Stored {len(conversations)} conversations")
 
+            # Another folder is on screen - keep the Inbox for when the user returns
+            if self._current_folder != FOLDER_INBOX:
+                self._set_loading(False)
+                self._start_prefetch()
+                return
+
+            # Count emails once for both the stats panel and the status line
+            total_emails = 0
+            for conv in conversations:
+                total_emails += conv.count
+
             # Display conversations
             logger.info("Displaying conversations in view...")
-            self.view.display_conversations(conversations)
+            self._show_conversations(conversations)
 
             # Update stats
             try:
-                total_emails = sum(conv.get('count', 0) for conv in conversations if isinstance(conv, dict))
                 self.view.update_stats(total_emails, len(conversations))
                 logger.info(f"Updated stats: {total_emails} emails, {len(conversations)} conversations")
             except Exception as e:
                 logger.error(f"Error updating stats: {e}")
 
             # Update status
-            self.view.set_loading(False)
+            self._set_loading(False)
 
             if len(conversations) == 0:
                 self.view.set_status("No emails found in inbox")
             else:
-                total_emails = sum(conv.get('count', 0) for conv in conversations if isinstance(conv, dict))
                 self.view.set_status(f"Loaded {len(conversations)} conversation(s) with {total_emails} email(s)")
 
             logger.info("Conversation loading completed successfully")
+            self._start_prefetch()
 
         except Exception as e:
             logger.error(f"Error in _on_conversations_loaded: {e}")
             logger.debug(f"Error traceback: {traceback.format_exc()}")
-            self.view.set_loading(False)
+            self._set_loading(False)
             self.view.set_status("Error displaying conversations")
             self.view.show_error(
                 "Display Error",
                 f"Failed to display conversations:\n{str(e)}\n\nCheck outlook_reader.log for details."
             )
 
+    def _set_conversations(self, conversations: List[Conversation]):
+        """Store the current conversations and rebuild the search index over them"""
+        self.current_conversations = conversations
+        if self._current_folder == FOLDER_INBOX:
+            self._search_index = ConversationSearchIndex(conversations)
+        self._oldest_loaded_time = min(
+            (conv.emails[0].received_time for conv in conversations
+             if conv.emails and conv.emails[0].received_time),
+            default=None
+        )
+
+    def _apply_read_states(self, read_states: Dict[str, bool]):
+        """
+        Bring the loaded conversations in line with the inbox: emails take
+        their current read state, and emails no longer in the inbox (deleted
+        or moved) are dropped, along with conversations left empty.
+        """
+        kept = []
+        removed_count = 0
+        for conv in self.current_conversations:
+            emails = [email for email in conv.emails if not email.entry_id or email.entry_id in read_states]
+            for email in emails:
+                if email.entry_id:
+                    email.unread = read_states[email.entry_id]
+            conv.has_unread = any(email.unread for email in emails)
+
+            if len(emails) != len(conv.emails):
+                removed_count += len(conv.emails) - len(emails)
+                if not emails:
+                    continue
+                conv.emails = emails
+                conv.count = len(emails)
+                conv.latest_time = emails[-1].received_time or conv.latest_time
+                conv.subject = emails[0].subject
+                conv.subject_lc = emails[0].subject_lc
+
+            kept.append(conv)
+
+        if removed_count:
+            logger.info(f"Dropped {removed_count} email(s) no longer in the inbox")
+            kept.sort(key=attrgetter('latest_time'), reverse=True)
+        self.current_conversations = kept
+
+    def _merge_conversations(self, delta: List[Conversation], older: bool = False) -> List[Conversation]:
+        """
+        Merge conversations from an incremental refresh (or, with older=True,
+        from an older page) into the current list.
+        Conversations are matched by conv_id and emails de-duplicated by entry_id;
+        emails that are already loaded take the read state from the delta.
+        Emails without a conversation ID or entry_id can't be matched across
+        loads (their keys are only unique within one fetch), so they are added as is.
+        Returns the merged list, newest conversation first.
+        """
+        by_id = {conv.conv_id: conv for conv in self.current_conversations}
+        # Loaded emails by entry_id, with the conversation holding each
+        known_emails = {
+            email.entry_id: (email, conv)
+            for conv in self.current_conversations
+            for email in conv.emails
+            if email.entry_id
+        }
+
+        merged_count = 0
+        added: List[Conversation] = []
+        # Existing conversations whose has_unread must be recomputed
+        touched: List[Conversation] = []
+        for conv in delta:
+            new_emails = []
+            for email in conv.emails:
+                known = known_emails.get(email.entry_id)
+                if known is None:
+                    new_emails.append(email)
+                elif known[0].unread != email.unread:
+                    known[0].unread = email.unread
+                    touched.append(known[1])
+
+            if not new_emails:
+                continue
+
+            merged_count += len(new_emails)
+            # Only Outlook conversation IDs identify the same conversation across loads
+            existing = by_id.get(conv.conv_id) if conv.emails[0].conv_id else None
+
+            if existing is None:
+                conv.emails = new_emails
+                conv.count = len(new_emails)
+                conv.has_unread = any(email.unread for email in new_emails)
+                added.append(conv)
+                continue
+
+            if older:
+                # Older page: emails go before everything already loaded and
+                # the conversation takes the subject of its (new) oldest email
+                existing.emails[:0] = new_emails
+                existing.subject = conv.subject
+                existing.subject_lc = conv.subject_lc
+            else:
+                # Incremental refresh: emails are newer than everything already loaded
+                existing.emails.extend(new_emails)
+                existing.latest_time = max(existing.latest_time, conv.latest_time)
+
+            existing.count = len(existing.emails)
+            touched.append(existing)
+
+        for existing in touched:
+            existing.has_unread = any(email.unread for email in existing.emails)
+
+        logger.info(f"Merged {merged_count} email(s) into {len(self.current_conversations)} conversation(s)")
+
+        if merged_count == 0:
+            return self.current_conversations
+
+        merged = self.current_conversations + added
+        merged.sort(key=attrgetter('latest_time'), reverse=True)
+        return merged
+
     def _on_load_error(self, error_message: str):
         """Handle conversation loading error"""
         logger.error(f"Conversation load error: {error_message}")
 
         try:
-            self.view.set_loading(False)
+            self._set_loading(False)
             self.view.set_status("Error loading conversations")
             self.view.show_error(
                 "Load Error",
@@ -222,73 +719,31 @@ class OutlookInboxApp:
             logger.error(f"Error in _on_load_error: {e}")
 
     def search_conversations(self, query: str):
-        """Search conversations by query"""
+        """Filter and display conversations matching the query (the view debounces typing)"""
         logger.info(f"Search requested: '{query}'")
 
         try:
-            # Validate conversations list
-            if not self.current_conversations:
+            # The index covers the folder on screen
+            conversations = self._search_index.conversations
+            if not conversations:
                 logger.info("No conversations to search")
                 return
 
-            if not isinstance(self.current_conversations, list):
-                logger.error(f"Invalid current_conversations type: {type(self.current_conversations)}")
-                return
-
             # Handle empty query
             if not query or not query.strip():
                 logger.info("Empty query - showing all conversations")
-                try:
-                    self.view.display_conversations(self.current_conversations)
-                    total_emails = sum(conv.get('count', 0) for conv in self.current_conversations if isinstance(conv, dict))
-                    self.view.set_status(f"Showing all {len(self.current_conversations)} conversation(s)")
-                except Exception as e:
-                    logger.error(f"Error displaying all conversations: {e}")
+                self._show_conversations(conversations)
+                self.view.set_status(f"Showing all {len(conversations)} conversation(s)")
                 return
 
-            # Filter conversations
-            query_lower = query.lower().strip()
-            filtered = []
-            error_count = 0
-
-            for conv in self.current_conversations:
-                try:
-                    if not isinstance(conv, dict):
-                        logger.warning(f"Skipping invalid conversation in search")
-                        error_count += 1
-                        continue
-
-                    # Search in subject
-                    subject = conv.get('subject', '')
-                    if isinstance(subject, str) and query_lower in subject.lower():
-                        filtered.append(conv)
-                        continue
-
-                    # Search in sender names
-                    emails = conv.get('emails', [])
-                    if isinstance(emails, list):
-                        for email in emails:
-                            if isinstance(email, dict):
-                                sender = email.get('sender', '')
-                                if isinstance(sender, str) and query_lower in sender.lower():
-                                    filtered.append(conv)
-                                    break
-
-                except Exception as e:
-                    logger.error(f"Error filtering conversation: {e}")
-                    error_count += 1
-                    continue
+            # Filter conversations through the index built at load time
+            filtered = self._search_index.search(query)
 
-            logger.info(f"Search found {len(filtered)} matching conversations ({error_count} errors)")
+            logger.info(f"Search found {len(filtered)} matching conversations")
 
             # Display filtered results
-            try:
-                self.view.display_conversations(filtered)
-                total_emails = sum(conv.get('count', 0) for conv in filtered if isinstance(conv, dict))
-                self.view.set_status(f"Found {len(filtered)} conversation(s) matching '{query}'")
-            except Exception as e:
-                logger.error(f"Error displaying search results: {e}")
-                self.view.set_status(f"Error displaying search results")
+            self._show_conversations(filtered)
+            self.view.set_status(f"Found {len(filtered)} conversation(s) matching '{query}'")
 
         except Exception as e:
             logger.error(f"Error in search_conversations: {e}")
@@ -310,7 +765,12 @@ class OutlookInboxApp:
         """Cleanup resources"""
         logger.info("Cleaning up resources...")
         try:
-            self.model.disconnect()
+            # Don't wait for a running fetch - Outlook may be stuck (e.g. on a
+            # security prompt); its last log records may be lost
+            self._fetch_executor.shutdown(wait=False, cancel_futures=True)
+            self._status_queue.close()
+            self._worker_log_listener.stop()
+            self.loop.close()
             logger.info("Cleanup completed successfully")
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
@@ -318,6 +778,7 @@ class OutlookInboxApp:
 
 def main():
     """Application entry point"""
+    log_listener = configure_logging()
     try:
         logger.info("Application starting...")
         app = OutlookInboxApp()
@@ -335,6 +796,7 @@ def main():
             pass
         logger.info("Application terminated")
         logger.info("="*60)
+        log_listener.stop()
 
 
 if __name__ == "__main__":
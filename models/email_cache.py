@@ -0,0 +1,134 @@
+"""
+Email Cache - SQLite sidecar storage for emails read from Outlook
+Lets the application show the last known inbox on startup without refetching
+"""
+
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from typing import List, Optional
+import logging
+
+from models.records import Email
+
+logger = logging.getLogger(__name__)
+
+
+class EmailCache:
+    """Persistent cache of emails keyed by Outlook EntryID"""
+
+    def __init__(self, path: str = 'outlook_cache.db'):
+        self.path = path
+        # The schema is created on first use, so an unwritable location only
+        # fails the (best-effort) cache operations, not construction
+        self._schema_ready = False
+        logger.info(f"EmailCache initialized ({path})")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection (one per call, so the cache can be used from any thread; callers close it)"""
+        conn = sqlite3.connect(self.path)
+        if not self._schema_ready:
+            try:
+                self._create_schema(conn)
+            except Exception:
+                conn.close()
+                raise
+            self._schema_ready = True
+        return conn
+
+    def _create_schema(self, conn: sqlite3.Connection):
+        """Create the emails table if it doesn't exist"""
+        with conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS emails (
+                    entry_id TEXT PRIMARY KEY,
+                    subject TEXT,
+                    sender TEXT,
+                    sender_email TEXT,
+                    received_time TEXT,
+                    received_ts REAL,
+                    conv_id TEXT,
+                    unread INTEGER
+                )
+                """
+            )
+
+    def load(self) -> List[Email]:
+        """
+        Load all cached emails, newest first.
+        Returns list of emails.
+        """
+        with closing(self._connect()) as conn, conn:
+            rows = conn.execute(
+                "SELECT entry_id, subject, sender, sender_email, received_time, conv_id, unread "
+                "FROM emails ORDER BY received_ts DESC"
+            ).fetchall()
+
+        emails = []
+        for entry_id, subject, sender, sender_email, received_time, conv_id, unread in rows:
+            emails.append(Email(
+                subject=subject,
+                sender=sender,
+                sender_email=sender_email,
+                received_time=datetime.fromisoformat(received_time) if received_time else None,
+                conv_id=conv_id,
+                unread=bool(unread),
+                entry_id=entry_id
+            ))
+
+        logger.info(f"Loaded {len(emails)} email(s) from cache")
+        return emails
+
+    def save(self, emails: List[Email], replace: bool = False):
+        """
+        Insert or update emails in the cache.
+        When replace is True, emails not in the list are removed.
+        """
+        rows = [
+            (
+                email.entry_id,
+                email.subject,
+                email.sender,
+                email.sender_email,
+                self._format_time(email.received_time),
+                self._timestamp(email.received_time),
+                email.conv_id,
+                int(email.unread)
+            )
+            for email in emails
+            if email.entry_id
+        ]
+
+        with closing(self._connect()) as conn, conn:
+            if replace:
+                conn.execute("DELETE FROM emails")
+            conn.executemany(
+                "INSERT OR REPLACE INTO emails "
+                "(entry_id, subject, sender, sender_email, received_time, received_ts, conv_id, unread) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+        logger.info(f"Saved {len(rows)} email(s) to cache")
+
+    def clear(self):
+        """Remove all cached emails"""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM emails")
+        logger.info("Cache cleared")
+
+    @staticmethod
+    def _format_time(value: Optional[datetime]) -> Optional[str]:
+        """Serialize a received time as ISO 8601"""
+        return value.isoformat() if value else None
+
+    @staticmethod
+    def _timestamp(value: Optional[datetime]) -> float:
+        """Sortable timestamp for a received time (0 when unknown)"""
+        if not value:
+            return 0.0
+        try:
+            return value.timestamp()
+        except (OverflowError, OSError, ValueError):
+            return 0.0
@@ -3,25 +3,75 @@ Outlook Model - Data layer for Outlook COM interactions
 Enhanced with comprehensive error handling and logging
 """
 
-import win32com.client
-from collections import defaultdict
-from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Dict, Optional, Tuple
 import logging
 import traceback
 
+from models.email_cache import EmailCache
+from models.records import Email, Conversation
+
 
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('outlook_reader.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# Message properties read for every email, in table column order
+TABLE_COLUMNS = (
+    'Subject',
+    'ConversationID',
+    'ReceivedTime',
+    'SenderName',
+    'SenderEmailAddress',
+    'UnRead',
+    'EntryID',
+)
+
+# DASL condition matching mail items (PR_MESSAGE_CLASS starting with IPM.Note,
+# which also covers signed/encrypted variants such as IPM.Note.SMIME)
+MAIL_ITEM_FILTER = '"http://schemas.microsoft.com/mapi/proptag/0x001A001F" LIKE \'IPM.Note%\''
+
+# Number of table rows fetched per GetArray call
+TABLE_BATCH_SIZE = 500
+
+# Default number of most recent messages read per page
+PAGE_SIZE = 500
+
+# Maximum number of emails kept in the in-memory EntryID cache
+EMAIL_CACHE_SIZE = 50000
+
+# Maximum concurrent per-item reads (more only makes Outlook throttle)
+HYDRATE_MAX_WORKERS = 8
+
+# Latest time of a conversation whose emails have no received time. pywin32
+# returns timezone-aware times, so the fallback must be aware to compare with them
+MISSING_TIME = datetime.min.replace(tzinfo=timezone.utc)
+
+# Default folders the GUI can show (Outlook OlDefaultFolders values; plain ints
+# so they can be passed to the worker process before pywin32 is imported)
+FOLDER_INBOX = 6
+FOLDER_SENT = 5
+FOLDER_DELETED = 3
+FOLDER_NAMES = {
+    FOLDER_INBOX: "Inbox",
+    FOLDER_SENT: "Sent Items",
+    FOLDER_DELETED: "Deleted Items",
+}
+
+
+def _build_restriction(*conditions: str) -> str:
+    """Combine DASL conditions into a single @SQL restriction string"""
+    return "@SQL=" + " AND ".join(f"({condition})" for condition in conditions)
+
+
+def _format_dasl_time(value: datetime) -> str:
+    """
+    Format a received time for a DASL date comparison (UTC, minute precision).
+    Outlook returns ReceivedTime in local time, but pywin32 labels every COM
+    date as UTC, so the label is dropped and the value converted from local time.
+    """
+    return value.replace(tzinfo=None).astimezone(timezone.utc).strftime("%m/%d/%Y %I:%M %p")
+
 
 class OutlookConnectionError(Exception):
     """Raised when connection to Outlook fails"""
@@ -36,11 +86,18 @@ class OutlookDataError(Exception):
 class OutlookModel:
     """Model class for interacting with Microsoft Outlook via COM"""
 
-    def __init__(self):
+    def __init__(self, cache_path: str = 'outlook_cache.db'):
         self.outlook = None
         self.namespace = None
         self.inbox = None
         self._connected = False
+        self._cache = EmailCache(cache_path)
+        # Received time of the newest email loaded so far (incremental refresh high-water mark)
+        self._last_sync: Optional[datetime] = None
+        # Emails already built this session, by EntryID (LRU order)
+        self._email_cache: OrderedDict = OrderedDict()
+        # Called with a progress message while emails are read
+        self.on_progress: Optional[Callable[[str], None]] = None
         logger.info("OutlookModel initialized")
 
     def connect(self) -> Tuple[bool, str]:
@@ -51,9 +108,15 @@ class OutlookModel:
         logger.info("Attempting to connect to Outlook...")
 
         try:
+            # pywin32 is imported on first connect, so the window can appear first
+            import win32com.client
+            from win32com.client import constants
+
             # Attempt to connect to Outlook
-            logger.debug("Dispatching Outlook.Application COM object...")
-            self.outlook = win32com.client.Dispatch("Outlook.Application")
+            # Early binding: the generated wrapper caches DISPIDs, so property
+            # reads don't need a GetIDsOfNames round trip each time
+            logger.debug("Dispatching Outlook.Application COM object (early-bound)...")
+            self.outlook = win32com.client.gencache.EnsureDispatch("Outlook.Application")
 
             if not self.outlook:
                 raise OutlookConnectionError("Failed to create Outlook COM object")
@@ -64,8 +127,8 @@ class OutlookModel:
             if not self.namespace:
                 raise OutlookConnectionError("Failed to get MAPI namespace")
 
-            logger.debug("Accessing Inbox folder (folder index 6)...")
-            self.inbox = self.namespace.GetDefaultFolder(6)  # 6 = Inbox
+            logger.debug("Accessing Inbox folder...")
+            self.inbox = self.namespace.GetDefaultFolder(constants.olFolderInbox)
 
             if not self.inbox:
                 raise OutlookConnectionError("Failed to access Inbox folder")
@@ -115,192 +178,173 @@ class OutlookModel:
             logger.error(f"Error getting inbox count: {e}")
             return 0
 
-    def get_conversations(self) -> List[Dict]:
+    def get_conversations(self, limit: Optional[int] = PAGE_SIZE,
+                          before: Optional[datetime] = None) -> List[Conversation]:
         """
-        Get all inbox messages grouped by conversation.
-        Returns list of conversation dictionaries.
+        Get the most recent inbox messages grouped by conversation.
+        Reads at most limit messages (None for the whole inbox); when before is
+        given, only messages received before that time are read, so older
+        pages can be loaded on demand and merged by the caller.
+        Returns list of conversations.
         """
-        logger.info("Starting to retrieve conversations...")
+        logger.info(f"Starting to retrieve conversations (limit={limit}, before={before})...")
 
-        if not self._connected:
-            error_msg = "Cannot get conversations - not connected to Outlook"
-            logger.error(error_msg)
-            raise OutlookDataError(error_msg)
+        conditions = [MAIL_ITEM_FILTER]
+        if before is not None:
+            # Minute precision: include the boundary minute, the caller de-duplicates
+            before_utc = _format_dasl_time(before + timedelta(minutes=1))
+            conditions.append(f'"urn:schemas:httpmail:datereceived" < \'{before_utc}\'')
 
-        if not self.inbox:
-            error_msg = "Cannot get conversations - inbox not initialized"
-            logger.error(error_msg)
-            raise OutlookDataError(error_msg)
+        emails = self._fetch_emails(_build_restriction(*conditions), limit)
+        # The newest page defines the cache; older pages are added to it
+        self._save_to_cache(emails, replace=before is None)
+        self._update_last_sync(emails)
+        return self._group_conversations(emails)
 
-        try:
-            # Get all messages
-            logger.debug("Accessing inbox items...")
-            messages = self.inbox.Items
+    def get_conversations_since(self, since: datetime, limit: Optional[int] = PAGE_SIZE) -> List[Conversation]:
+        """
+        Get up to limit inbox messages received at or after a point in time,
+        grouped by conversation.
+        Used for incremental refresh; the caller merges the result into the
+        conversations it already holds (emails are identified by entry_id).
+        A result that fills the limit may not reach back to since, so it is
+        treated as a new newest page (the caller should replace, not merge).
+        """
+        logger.info(f"Retrieving conversations received since {since} (limit={limit})...")
+
+        # DASL compares dates in UTC with minute precision, so emails from the
+        # boundary minute are read again and must be de-duplicated by the caller
+        since_utc = _format_dasl_time(since)
+        received_condition = f'"urn:schemas:httpmail:datereceived" >= \'{since_utc}\''
+
+        emails = self._fetch_emails(_build_restriction(MAIL_ITEM_FILTER, received_condition), limit)
+        is_full_page = limit is not None and len(emails) >= limit
+        if is_full_page:
+            logger.info("Incremental read filled a whole page - replacing cached emails")
+        self._save_to_cache(emails, replace=is_full_page)
+        self._update_last_sync(emails)
+        return self._group_conversations(emails)
+
+    def get_read_states(self, since: datetime) -> Dict[str, bool]:
+        """
+        Get the read state of every inbox email received at or after a point
+        in time, by EntryID.
+        Only EntryID and UnRead are read, so this is cheap enough to run with
+        every incremental refresh; loaded emails missing from the result were
+        deleted or moved elsewhere.
+        """
+        logger.info(f"Reading read states of emails received since {since}...")
 
-            if not messages:
-                logger.warning("Inbox.Items is None or empty")
-                return []
+        if not self._connected or not self.inbox:
+            raise OutlookDataError("Cannot read read states - not connected to Outlook")
 
-            message_count = messages.Count
-            logger.info(f"Found {message_count} messages in inbox")
+        since_utc = _format_dasl_time(since)
+        received_condition = f'"urn:schemas:httpmail:datereceived" >= \'{since_utc}\''
 
-            if message_count == 0:
-                logger.info("Inbox is empty - returning empty conversation list")
-                return []
+        try:
+            table = self.inbox.GetTable(_build_restriction(MAIL_ITEM_FILTER, received_condition))
+            table.Columns.RemoveAll()
+            table.Columns.Add('EntryID')
+            table.Columns.Add('UnRead')
+
+            read_states = {}
+            while not table.EndOfTable:
+                rows = table.GetArray(TABLE_BATCH_SIZE)
+                if not rows:
+                    break
+                for entry_id, unread in rows:
+                    read_states[entry_id] = bool(unread)
 
-            conversations = defaultdict(list)
-            processed_count = 0
-            error_count = 0
+        except Exception as e:
+            logger.error(f"Error reading read states: {e}")
+            raise OutlookDataError(f"Cannot read read states: {str(e)}")
 
-            # Process each message
-            logger.debug(f"Processing {message_count} messages...")
-            for i, message in enumerate(messages, 1):
-                try:
-                    # Log progress every 50 messages
-                    if i % 50 == 0:
-                        logger.debug(f"Processing message {i}/{message_count}")
-
-                    # Check message class (only process mail items)
-                    try:
-                        msg_class = message.Class
-                        # 43 = olMail (standard email message)
-                        if msg_class != 43:
-                            logger.debug(f"Skipping non-email item (class={msg_class})")
-                            continue
-                    except Exception as e:
-                        logger.warning(f"Cannot get message class, skipping: {e}")
-                        continue
+        logger.info(f"Read {len(read_states)} read state(s)")
+        return read_states
 
-                    # Extract message properties safely
-                    try:
-                        subject = self._safe_get_property(message, 'Subject', "(No Subject)")
-                    except Exception as e:
-                        logger.warning(f"Error getting subject: {e}")
-                        subject = "(No Subject)"
-
-                    try:
-                        conv_id = self._safe_get_property(message, 'ConversationID', None)
-                    except Exception as e:
-                        logger.debug(f"No ConversationID available: {e}")
-                        conv_id = None
-
-                    try:
-                        received_time = self._safe_get_property(message, 'ReceivedTime', None)
-                    except Exception as e:
-                        logger.warning(f"Error getting received time: {e}")
-                        received_time = None
-
-                    try:
-                        sender = self._safe_get_property(message, 'SenderName', "Unknown")
-                    except Exception as e:
-                        logger.warning(f"Error getting sender: {e}")
-                        sender = "Unknown"
-
-                    try:
-                        sender_email = self._safe_get_property(message, 'SenderEmailAddress', "")
-                    except Exception as e:
-                        logger.debug(f"Error getting sender email: {e}")
-                        sender_email = ""
-
-                    try:
-                        unread = self._safe_get_property(message, 'UnRead', False)
-                    except Exception as e:
-                        logger.debug(f"Error getting unread status: {e}")
-                        unread = False
-
-                    # Use conversation ID or unique ID as grouping key
-                    if conv_id:
-                        group_key = conv_id
-                    else:
-                        # Create unique key for non-threaded emails
-                        try:
-                            entry_id = self._safe_get_property(message, 'EntryID', None)
-                            group_key = f"single_{entry_id}" if entry_id else f"single_{i}"
-                        except:
-                            group_key = f"single_{i}"
-
-                    # Add to conversations
-                    email_data = {
-                        'subject': subject,
-                        'sender': sender,
-                        'sender_email': sender_email,
-                        'received_time': received_time,
-                        'conv_id': conv_id,
-                        'unread': unread
-                    }
-
-                    conversations[group_key].append(email_data)
-                    processed_count += 1
-
-                    logger.debug(f"Processed email: '{subject[:50]}...' from {sender}")
+    def get_folder_conversations(self, folder_id: int, limit: Optional[int] = PAGE_SIZE) -> List[Conversation]:
+        """
+        Get the most recent messages of another default folder (e.g. Sent Items)
+        grouped by conversation.
+        Unlike the Inbox, the result is not stored in the local cache and does
+        not move the incremental refresh high-water mark.
+        """
+        logger.info(f"Retrieving conversations from folder {folder_id} (limit={limit})...")
 
-                except Exception as e:
-                    error_count += 1
-                    logger.error(f"Error processing message {i}: {e}")
-                    logger.debug(f"Message processing error traceback: {traceback.format_exc()}")
-                    continue
+        if not self._connected:
+            raise OutlookDataError("Cannot get conversations - not connected to Outlook")
 
-            logger.info(f"Processed {processed_count}/{message_count} messages successfully ({error_count} errors)")
-            logger.info(f"Grouped into {len(conversations)} conversation(s)")
+        try:
+            folder = self.namespace.GetDefaultFolder(folder_id)
+        except Exception as e:
+            logger.error(f"Error opening folder {folder_id}: {e}")
+            raise OutlookDataError(f"Cannot open folder: {str(e)}")
 
-            if processed_count == 0:
-                logger.warning("No messages were successfully processed")
-                return []
+        emails = self._fetch_emails(_build_restriction(MAIL_ITEM_FILTER), limit, folder)
+        return self._group_conversations(emails)
 
-            # Sort emails within each conversation by time (oldest first)
-            logger.debug("Sorting emails within conversations...")
-            for conv_id in conversations:
-                try:
-                    conversations[conv_id].sort(
-                        key=lambda x: x['received_time'] if x['received_time'] else datetime.min
-                    )
-                except Exception as e:
-                    logger.error(f"Error sorting conversation {conv_id}: {e}")
+    def load_cached_conversations(self) -> List[Conversation]:
+        """
+        Get the conversations stored in the local cache by a previous session.
+        Does not require a connection to Outlook.
+        """
+        logger.info("Loading conversations from cache...")
 
-            # Convert to list and sort conversations by most recent message
-            logger.debug("Building conversation list...")
-            conversation_list = []
+        try:
+            emails = self._cache.load()
+        except Exception as e:
+            logger.error(f"Error loading cache: {e}")
+            return []
 
-            for conv_id, emails in conversations.items():
-                try:
-                    # Get latest time
-                    valid_times = [email['received_time'] for email in emails if email['received_time']]
-                    latest_time = max(valid_times) if valid_times else datetime.min
+        self._update_last_sync(emails)
+        return self._group_conversations(emails)
 
-                    # Check for unread
-                    has_unread = any(email.get('unread', False) for email in emails)
+    def get_last_sync(self) -> Optional[datetime]:
+        """Get the received time of the newest email loaded so far (None before the first load)"""
+        return self._last_sync
 
-                    # Get subject
-                    subject = emails[0]['subject'] if emails else "(No Subject)"
+    def update_last_sync(self, conversations: List[Conversation]):
+        """Advance the high-water mark from conversations loaded elsewhere (e.g. by a worker process)"""
+        self._update_last_sync([conv.emails[-1] for conv in conversations if conv.emails])
 
-                    conversation_list.append({
-                        'conv_id': conv_id,
-                        'emails': emails,
-                        'latest_time': latest_time,
-                        'count': len(emails),
-                        'has_unread': has_unread,
-                        'subject': subject
-                    })
+    def _update_last_sync(self, emails: List[Email]):
+        """Advance the high-water mark to the newest received time in emails"""
+        latest = max((email.received_time for email in emails if email.received_time), default=None)
+        if latest and (self._last_sync is None or latest > self._last_sync):
+            self._last_sync = latest
+            logger.debug(f"Last sync time is now {latest}")
 
-                except Exception as e:
-                    logger.error(f"Error building conversation entry: {e}")
-                    continue
+    def _save_to_cache(self, emails: List[Email], replace: bool = False):
+        """Write emails to the local cache; failures are logged, not raised"""
+        try:
+            self._cache.save(emails, replace=replace)
+        except Exception as e:
+            logger.error(f"Error saving emails to cache: {e}")
 
-            # Sort by latest message time (newest first)
-            logger.debug("Sorting conversations by latest time...")
-            try:
-                conversation_list.sort(key=lambda x: x['latest_time'], reverse=True)
-            except Exception as e:
-                logger.error(f"Error sorting conversations: {e}")
+    def _fetch_emails(self, restriction: str, limit: Optional[int] = None, folder=None) -> List[Email]:
+        """
+        Read up to limit emails matching a restriction, newest first, from a
+        folder (the inbox by default).
+        Filtering and sorting are done by Outlook, so no Python-side sort is needed.
+        """
+        if not self._connected:
+            error_msg = "Cannot get conversations - not connected to Outlook"
+            logger.error(error_msg)
+            raise OutlookDataError(error_msg)
 
-            logger.info(f"Successfully built {len(conversation_list)} conversation(s)")
+        if not self.inbox:
+            error_msg = "Cannot get conversations - inbox not initialized"
+            logger.error(error_msg)
+            raise OutlookDataError(error_msg)
+
+        try:
+            emails, message_count, error_count = self._read_emails(restriction, limit, folder if folder is not None else self.inbox)
+            logger.info(f"Processed {len(emails)}/{message_count} messages successfully ({error_count} errors)")
 
-            # Log summary
-            total_emails = sum(conv['count'] for conv in conversation_list)
-            unread_convs = sum(1 for conv in conversation_list if conv['has_unread'])
-            logger.info(f"Summary: {total_emails} emails, {len(conversation_list)} conversations, {unread_convs} with unread")
+            if message_count and not emails:
+                logger.warning("No messages were successfully processed")
 
-            return conversation_list
+            return emails
 
         except OutlookDataError:
             # Re-raise our custom exceptions
@@ -311,62 +355,317 @@ class OutlookModel:
             logger.debug(f"Error traceback: {traceback.format_exc()}")
             raise OutlookDataError(error_msg)
 
-    def _safe_get_property(self, obj, prop_name: str, default=None):
+    def _group_conversations(self, emails: List[Email]) -> List[Conversation]:
         """
-        Safely get a property from a COM object.
-        Returns default if property doesn't exist or fails.
+        Group emails (newest first) into conversations in a single pass.
+        Conversations are created in order of their latest message, so the
+        result is already sorted newest first; each group's emails are
+        reversed once at the end to list them oldest first.
         """
-        try:
-            if hasattr(obj, prop_name):
-                value = getattr(obj, prop_name)
-                # Handle None/empty values
-                if value is None:
-                    return default
-                return value
+        if not emails:
+            logger.info("No emails - returning empty conversation list")
+            return []
+
+        logger.debug("Building conversation list...")
+        conv_map: Dict[str, Conversation] = {}
+
+        for i, email_data in enumerate(emails, 1):
+            # Use conversation ID or unique ID as grouping key
+            conv_id = email_data.conv_id
+            if conv_id:
+                group_key = conv_id
             else:
-                return default
+                # Create unique key for non-threaded emails
+                entry_id = email_data.entry_id
+                group_key = f"single_{entry_id}" if entry_id else f"single_{i}"
+
+            entry = conv_map.get(group_key)
+            if entry is None:
+                # First email seen for a conversation is its latest one
+                entry = conv_map[group_key] = Conversation(
+                    conv_id=group_key,
+                    emails=[],
+                    latest_time=email_data.received_time or MISSING_TIME,
+                    count=0,
+                    has_unread=False,
+                    subject=email_data.subject
+                )
+
+            entry.emails.append(email_data)
+            if email_data.unread:
+                entry.has_unread = True
+
+        # Per-conversation fields are filled in once per group rather than
+        # once per email
+        conversation_list = list(conv_map.values())
+        for conv in conversation_list:
+            emails_in_conv = conv.emails
+            emails_in_conv.reverse()
+            conv.count = len(emails_in_conv)
+            # Conversation subject is the subject of its oldest email
+            oldest = emails_in_conv[0]
+            conv.subject = oldest.subject
+            conv.subject_lc = oldest.subject_lc
+
+        logger.info(f"Successfully built {len(conversation_list)} conversation(s)")
+
+        # Log summary
+        total_emails = sum(conv.count for conv in conversation_list)
+        unread_convs = sum(1 for conv in conversation_list if conv.has_unread)
+        logger.info(f"Summary: {total_emails} emails, {len(conversation_list)} conversations, {unread_convs} with unread")
+
+        return conversation_list
+
+    def _read_emails(self, restriction: str, limit: Optional[int], folder) -> Tuple[List[Email], int, int]:
+        """
+        Read up to limit mail items of a folder matching a restriction as a flat
+        list of emails, newest first.
+        Uses a single batched Table projection and falls back to per-item reads
+        if the Table API is unavailable.
+        Returns: (emails, message_count, error_count)
+        """
+        try:
+            return self._read_emails_from_table(restriction, limit, folder)
         except Exception as e:
-            logger.debug(f"Cannot get property '{prop_name}': {e}")
-            return default
+            logger.warning(f"Bulk table read failed, falling back to per-item reads: {e}")
+            logger.debug(f"Table read error traceback: {traceback.format_exc()}")
+            return self._read_emails_per_item(restriction, limit, folder)
 
-    def search_conversations(self, query: str) -> List[Dict]:
+    def _read_emails_from_table(self, restriction: str, limit: Optional[int], folder) -> Tuple[List[Email], int, int]:
         """
-        Search conversations by subject or sender.
-        Returns filtered list of conversations.
+        Read a folder's emails through Folder.GetTable.
+        All requested columns come back from Outlook in one projection, and
+        rows are fetched in batches with GetArray instead of dispatching each
+        property of each message separately.
         """
-        logger.info(f"Searching conversations for: '{query}'")
+        logger.debug("Opening folder table...")
+        table = folder.GetTable(restriction)
+        table.Sort("[ReceivedTime]", True)
+        table.Columns.RemoveAll()
+
+        # Some stores refuse certain columns; remember those and read them per item
+        columns = []
+        missing_columns = []
+        for column in TABLE_COLUMNS:
+            try:
+                table.Columns.Add(column)
+                columns.append(column)
+            except Exception as e:
+                logger.warning(f"Table column '{column}' unavailable, will read per item: {e}")
+                missing_columns.append(column)
 
-        try:
-            if not query or not query.strip():
-                logger.debug("Empty query - returning all conversations")
-                return self.get_conversations()
+        if 'EntryID' not in columns:
+            raise OutlookDataError("Inbox table does not expose EntryID")
+
+        message_count = table.GetRowCount()
+        logger.info(f"Found {message_count} matching messages in folder")
 
-            all_conversations = self.get_conversations()
-            query_lower = query.lower().strip()
+        emails = []
+        pending = []
+        error_count = 0
+        row_index = 0
 
-            filtered = []
-            for conv in all_conversations:
+        while not table.EndOfTable and (limit is None or row_index < limit):
+            batch_size = TABLE_BATCH_SIZE if limit is None else min(TABLE_BATCH_SIZE, limit - row_index)
+            rows = table.GetArray(batch_size)
+            if not rows:
+                break
+
+            for values in rows:
+                row_index += 1
                 try:
-                    # Search in subject
-                    if query_lower in conv['subject'].lower():
-                        filtered.append(conv)
+                    record = dict(zip(columns, values))
+
+                    # Known emails are reused; only their read state can change
+                    email_data = self._get_cached_email(record['EntryID'])
+                    if email_data is not None:
+                        if 'UnRead' in record:
+                            email_data.unread = bool(record['UnRead'])
+                        emails.append(email_data)
+                        continue
+
+                    if missing_columns:
+                        # Read per item after the table pass; keep the slot for ordering
+                        pending.append((len(emails), record))
+                        emails.append(None)
                         continue
 
-                    # Search in sender names
-                    for email in conv['emails']:
-                        if query_lower in email['sender'].lower():
-                            filtered.append(conv)
-                            break
+                    email_data = self._build_email_data(record)
+                    self._remember_email(email_data)
+                    emails.append(email_data)
+
                 except Exception as e:
-                    logger.error(f"Error filtering conversation: {e}")
+                    error_count += 1
+                    logger.error(f"Error processing message {row_index}: {e}")
+                    logger.debug(f"Message processing error traceback: {traceback.format_exc()}")
                     continue
 
-            logger.info(f"Found {len(filtered)} matching conversation(s)")
-            return filtered
+            logger.debug("Read %d/%d table rows", row_index, message_count)
+            if self.on_progress:
+                total = message_count if limit is None else min(limit, message_count)
+                self.on_progress(f"Reading emails... {row_index}/{total}")
 
-        except Exception as e:
-            logger.error(f"Error in search: {e}")
-            raise OutlookDataError(f"Search failed: {str(e)}")
+        if pending:
+            error_count += self._hydrate_records(emails, pending, missing_columns)
+            emails = [email_data for email_data in emails if email_data is not None]
+
+        return emails, message_count, error_count
+
+    def _hydrate_records(self, emails: List[Optional[Email]], pending: List[Tuple[int, Dict]],
+                         missing_columns: List[str]) -> int:
+        """
+        Read the columns the table couldn't provide from each item and build
+        the pending emails into their slots in emails.
+        Items are read concurrently when COM runs multithreaded (fetch worker
+        process); otherwise one at a time.
+        Returns the number of items that could not be read.
+        """
+        def hydrate(record: Dict) -> Email:
+            item = self.namespace.GetItemFromID(record['EntryID'])
+            for column in missing_columns:
+                record[column] = self._safe_get_property(item, column, None)
+            return self._build_email_data(record)
+
+        error_count = 0
+
+        if _com_multithreaded and len(pending) > 1:
+            logger.debug(f"Reading {len(pending)} item(s) with {HYDRATE_MAX_WORKERS} threads...")
+            with ThreadPoolExecutor(max_workers=HYDRATE_MAX_WORKERS, thread_name_prefix="outlook-item") as pool:
+                futures = {
+                    pool.submit(_call_in_mta, hydrate, record): index
+                    for index, record in pending
+                }
+                results = [(futures[future], future) for future in as_completed(futures)]
+
+            for index, future in results:
+                try:
+                    emails[index] = future.result()
+                    self._remember_email(emails[index])
+                except Exception as e:
+                    error_count += 1
+                    logger.error(f"Error reading message {index + 1}: {e}")
+        else:
+            for index, record in pending:
+                try:
+                    emails[index] = hydrate(record)
+                    self._remember_email(emails[index])
+                except Exception as e:
+                    error_count += 1
+                    logger.error(f"Error reading message {index + 1}: {e}")
+                    logger.debug(f"Message read error traceback: {traceback.format_exc()}")
+
+        return error_count
+
+    def _read_emails_per_item(self, restriction: str, limit: Optional[int], folder) -> Tuple[List[Email], int, int]:
+        """
+        Read a folder's emails one message at a time.
+        Slow fallback used only when the Table API cannot be used.
+        """
+        logger.debug("Accessing folder items...")
+        messages = folder.Items.Restrict(restriction)
+        messages.Sort("[ReceivedTime]", True)
+
+        if not messages:
+            logger.warning("Folder items are None or empty")
+            return [], 0, 0
+
+        message_count = messages.Count
+        logger.info(f"Found {message_count} matching messages in folder")
+
+        emails = []
+        error_count = 0
+
+        logger.debug(f"Processing {message_count} messages...")
+        for i, message in enumerate(messages, 1):
+            if limit is not None and i > limit:
+                break
+
+            try:
+                # Log progress every 50 messages
+                if i % 50 == 0:
+                    logger.debug("Processing message %d/%d", i, message_count)
+
+                # Known emails are reused; only their read state can change
+                entry_id = self._safe_get_property(message, 'EntryID', None)
+                email_data = self._get_cached_email(entry_id)
+                if email_data is not None:
+                    email_data.unread = bool(self._safe_get_property(message, 'UnRead', False))
+                    emails.append(email_data)
+                    continue
+
+                record = {
+                    column: self._safe_get_property(message, column, None)
+                    for column in TABLE_COLUMNS
+                }
+                email_data = self._build_email_data(record)
+                self._remember_email(email_data)
+                emails.append(email_data)
+
+            except Exception as e:
+                error_count += 1
+                logger.error(f"Error processing message {i}: {e}")
+                logger.debug(f"Message processing error traceback: {traceback.format_exc()}")
+                continue
+
+        return emails, message_count, error_count
+
+    def _get_cached_email(self, entry_id: Optional[str]) -> Optional[Email]:
+        """Get a previously built email by EntryID (None if not cached)"""
+        if not entry_id:
+            return None
+
+        email_data = self._email_cache.get(entry_id)
+        if email_data is not None:
+            self._email_cache.move_to_end(entry_id)
+        return email_data
+
+    def _remember_email(self, email_data: Email):
+        """Cache an email by EntryID, evicting the least recently used"""
+        entry_id = email_data.entry_id
+        if not entry_id:
+            return
+
+        self._email_cache[entry_id] = email_data
+        if len(self._email_cache) > EMAIL_CACHE_SIZE:
+            self._email_cache.popitem(last=False)
+
+    def _build_email_data(self, record: Dict) -> Email:
+        """Build an email from a row of raw property values"""
+        subject = record.get('Subject')
+        sender = record.get('SenderName')
+        sender_email = record.get('SenderEmailAddress')
+        unread = record.get('UnRead')
+
+        email_data = Email(
+            subject=subject if subject is not None else "(No Subject)",
+            sender=sender if sender is not None else "Unknown",
+            sender_email=sender_email if sender_email is not None else "",
+            received_time=record.get('ReceivedTime'),
+            conv_id=record.get('ConversationID'),
+            unread=bool(unread) if unread is not None else False,
+            entry_id=record.get('EntryID')
+        )
+
+        # Hot path: %-style arguments are only formatted if DEBUG is enabled
+        logger.debug("Processed email: '%.50s...' from %s", email_data.subject, email_data.sender)
+        return email_data
+
+    def _safe_get_property(self, obj, prop_name: str, default=None):
+        """
+        Safely get a property from a COM object.
+        Returns default if property doesn't exist or fails.
+        """
+        # A single getattr: hasattr() first would cost a second COM dispatch.
+        # Missing properties raise AttributeError, failing ones com_error
+        try:
+            value = getattr(obj, prop_name)
+            # Handle None/empty values
+            if value is None:
+                return default
+            return value
+        except Exception:
+            # Called for every property of every message - misses are not logged
+            return default
 
     def get_folder_list(self) -> List[str]:
         """Get list of available Outlook folders"""
@@ -402,6 +701,113 @@ class OutlookModel:
             self.namespace = None
             self.inbox = None
             self._connected = False
+            self._email_cache.clear()
             logger.info("Disconnected successfully")
         except Exception as e:
             logger.error(f"Error during disconnect: {e}")
+
+
+# Model owned by a fetch worker process (see connect_worker)
+_worker_model: Optional[OutlookModel] = None
+
+# Queue for status messages shown by the GUI process (set by init_fetch_worker)
+_status_queue = None
+
+# True once COM runs in the multithreaded apartment, where Outlook proxies
+# may be shared between threads without marshalling
+_com_multithreaded = False
+
+
+def init_fetch_worker(status_queue=None):
+    """
+    Initialize COM in a worker process before it talks to Outlook.
+    The multithreaded apartment is used when the caller set sys.coinit_flags
+    before pywin32 was imported; otherwise Outlook is read from this thread only.
+    Progress messages are put on status_queue, when given.
+    """
+    global _com_multithreaded, _status_queue
+    import pythoncom
+
+    _status_queue = status_queue
+    try:
+        # Succeeds (S_OK or S_FALSE) only if the thread is, or can become, MTA
+        pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
+        _com_multithreaded = True
+    except pythoncom.com_error as e:
+        # RPC_E_CHANGED_MODE: pythoncom's import already joined a single-threaded apartment
+        logger.warning(f"COM is not multithreaded in the fetch worker - reading serially ({e})")
+        _com_multithreaded = False
+    logger.info(f"Fetch worker process initialized (multithreaded COM: {_com_multithreaded})")
+
+
+def _report_status(message: str):
+    """Send a status message to the GUI process"""
+    _status_queue.put_nowait(message)
+
+
+def _call_in_mta(func, *args):
+    """Run func on a pool thread joined to the multithreaded COM apartment"""
+    import pythoncom
+    pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
+    try:
+        return func(*args)
+    finally:
+        pythoncom.CoUninitialize()
+
+
+def connect_worker() -> Tuple[bool, str]:
+    """
+    Connect to Outlook inside a worker process; the connection is kept for
+    later fetches. This is the application's only Outlook connection.
+    Returns: (success: bool, message: str)
+    """
+    global _worker_model
+
+    if _worker_model is not None and _worker_model.is_connected():
+        return True, "Already connected to Outlook"
+
+    model = OutlookModel()
+    if _status_queue is not None:
+        model.on_progress = _report_status
+    success, message = model.connect()
+    if success:
+        _worker_model = model
+    return success, message
+
+
+def fetch_conversations(since: Optional[datetime] = None,
+                        before: Optional[datetime] = None) -> List[Conversation]:
+    """
+    Read conversations from Outlook inside a worker process.
+    Connects on first use and keeps the connection for later calls.
+    Returns the most recent page of conversations, those received since a
+    given time, or the page received before a given time.
+    """
+    model = _get_worker_model()
+
+    if before is not None:
+        return model.get_conversations(before=before)
+    if since is not None:
+        return model.get_conversations_since(since)
+    return model.get_conversations()
+
+
+def fetch_read_states(since: datetime) -> Dict[str, bool]:
+    """Read the read state of inbox emails received since a given time inside a worker process"""
+    return _get_worker_model().get_read_states(since)
+
+
+def fetch_folder_conversations(folder_id: int, limit: Optional[int] = PAGE_SIZE) -> List[Conversation]:
+    """Read the most recent conversations of a default folder inside a worker process"""
+    return _get_worker_model().get_folder_conversations(folder_id, limit)
+
+
+def _get_worker_model() -> OutlookModel:
+    """Return the worker process's model, connecting on first use"""
+    if _worker_model is None or not _worker_model.is_connected():
+        # A replacement worker (after a crash) reconnects here
+        success, message = connect_worker()
+        if not success:
+            raise OutlookConnectionError(message)
+
+    return _worker_model
@@ -0,0 +1,42 @@
+"""
+Records - Compact data types for emails and conversations read from Outlook
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+
+@dataclass(slots=True)
+class Email:
+    """A single email message"""
+    subject: str
+    sender: str
+    sender_email: str
+    received_time: Optional[datetime]
+    conv_id: Optional[str]
+    unread: bool
+    entry_id: Optional[str]
+    # Lowercased copies computed once at ingest, for case-insensitive search
+    subject_lc: str = field(init=False, repr=False, compare=False)
+    sender_lc: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.subject_lc = self.subject.lower() if isinstance(self.subject, str) else ''
+        self.sender_lc = self.sender.lower() if isinstance(self.sender, str) else ''
+
+
+@dataclass(slots=True)
+class Conversation:
+    """Emails sharing a conversation, oldest first"""
+    conv_id: str
+    emails: List[Email]
+    latest_time: datetime
+    count: int
+    has_unread: bool
+    subject: str
+    # Lowercased subject for case-insensitive search
+    subject_lc: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.subject_lc = self.subject.lower() if isinstance(self.subject, str) else ''
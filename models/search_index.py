@@ -0,0 +1,79 @@
+"""
+Search Index - In-memory index for filtering conversations by subject or sender
+Built once per load so each search keystroke doesn't re-scan every email
+"""
+
+from collections import defaultdict
+from typing import List, Dict, Set
+import logging
+
+from models.records import Conversation
+
+logger = logging.getLogger(__name__)
+
+
+# Above this many conversations a trigram index is built to narrow candidates
+TRIGRAM_THRESHOLD = 2000
+
+
+class ConversationSearchIndex:
+    """Searchable representation of a conversation list"""
+
+    def __init__(self, conversations: List[Conversation]):
+        self.conversations = conversations
+
+        # One lowercased blob per conversation: subject and sender names,
+        # separated by newlines so a query can't match across fields.
+        # Records are lowercased at ingest, so no lower() is needed here
+        self._blobs: List[str] = [
+            '\n'.join([conv.subject_lc] + [email.sender_lc for email in conv.emails])
+            for conv in conversations
+        ]
+
+        self._trigrams: Dict[str, Set[int]] = {}
+        if len(conversations) > TRIGRAM_THRESHOLD:
+            self._build_trigrams()
+
+        logger.debug(f"Search index built for {len(conversations)} conversations (trigrams: {bool(self._trigrams)})")
+
+    def _build_trigrams(self):
+        """Map every trigram to the indices of the conversations containing it"""
+        trigrams = defaultdict(set)
+        for i, blob in enumerate(self._blobs):
+            for j in range(len(blob) - 2):
+                trigrams[blob[j:j + 3]].add(i)
+        self._trigrams = dict(trigrams)
+
+    def search(self, query: str) -> List[Conversation]:
+        """
+        Find conversations whose subject or any sender contains the query (case-insensitive).
+        Returns matching conversations in their original order.
+        """
+        query_lower = query.lower().strip()
+        if not query_lower:
+            return list(self.conversations)
+
+        blobs = self._blobs
+
+        if self._trigrams and len(query_lower) >= 3:
+            candidates = None
+            for j in range(len(query_lower) - 2):
+                indices = self._trigrams.get(query_lower[j:j + 3])
+                if not indices:
+                    return []
+                candidates = indices if candidates is None else candidates & indices
+                if not candidates:
+                    return []
+
+            # Trigrams only narrow the candidates - verify the full substring
+            return [
+                self.conversations[i]
+                for i in sorted(candidates)
+                if query_lower in blobs[i]
+            ]
+
+        return [
+            conv
+            for conv, blob in zip(self.conversations, blobs)
+            if query_lower in blob
+        ]
@@ -3,79 +3,130 @@ Microsoft Outlook Inbox Reader
 Reads and displays email subjects from Outlook Inbox grouped by conversation
 """
 
-import win32com.client
-from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
+# DASL condition matching mail items (message class IPM.Note, including signed/encrypted variants)
+MAIL_ITEM_FILTER = '"http://schemas.microsoft.com/mapi/proptag/0x001A001F" LIKE \'IPM.Note%\''
 
-def read_outlook_inbox_conversations():
+# Default window read by the CLI: messages from the last DEFAULT_DAYS days, at most DEFAULT_LIMIT
+DEFAULT_DAYS = 30
+DEFAULT_LIMIT = 500
+
+# Message properties read from the inbox table, in column order
+TABLE_COLUMNS = ('ConversationID', 'Subject', 'ReceivedTime', 'SenderName')
+
+# Outlook handles, acquired on first use and reused by later reads
+_OUTLOOK = None
+_NS = None
+_INBOX = None
+
+
+def _get_inbox():
     """
-    Connect to Microsoft Outlook via COM and read inbox emails grouped by conversation.
-    Returns a dictionary of conversations.
+    Return the Outlook Inbox folder, connecting to Outlook on first use.
+    The Application, Namespace and Inbox handles are cached between calls.
     """
-    try:
-        # Connect to Outlook application
-        outlook = win32com.client.Dispatch("Outlook.Application")
-        namespace = outlook.GetNamespace("MAPI")
+    global _OUTLOOK, _NS, _INBOX
 
-        # Access the Inbox folder (folder index 6 is Inbox)
-        inbox = namespace.GetDefaultFolder(6)
+    if _INBOX is None:
+        # pywin32 is imported on first use (cached in sys.modules afterwards)
+        import win32com.client
+        from win32com.client import constants
 
-        # Get all messages from inbox
-        messages = inbox.Items
+        # Connect to Outlook application (early-bound, so property reads use cached DISPIDs)
+        _OUTLOOK = win32com.client.gencache.EnsureDispatch("Outlook.Application")
+        _NS = _OUTLOOK.GetNamespace("MAPI")
 
-        # Group messages by conversation
-        conversations = defaultdict(list)
+        # Access the Inbox folder
+        _INBOX = _NS.GetDefaultFolder(constants.olFolderInbox)
+
+    return _INBOX
 
-        for message in messages:
-            try:
-                # Get conversation ID and email details
-                conv_id = message.ConversationID if hasattr(message, 'ConversationID') else None
-                subject = message.Subject if message.Subject else "(No Subject)"
-                received_time = message.ReceivedTime if hasattr(message, 'ReceivedTime') else None
-                sender = message.SenderName if hasattr(message, 'SenderName') else "Unknown"
 
-                # Use conversation ID or subject as grouping key
-                # If no conversation ID, use subject as fallback
-                group_key = conv_id if conv_id else f"single_{subject}"
+def _reset_outlook():
+    """Drop the cached Outlook handles so the next read reconnects"""
+    global _OUTLOOK, _NS, _INBOX
+    _OUTLOOK = _NS = _INBOX = None
 
-                conversations[group_key].append({
+
+def _received_since_filter(days):
+    """DASL condition matching messages received in the last given number of days"""
+    # DASL compares dates in UTC
+    since = datetime.now(timezone.utc) - timedelta(days=days)
+    return f'"urn:schemas:httpmail:datereceived" >= \'{since.strftime("%m/%d/%Y %I:%M %p")}\''
+
+
+def read_outlook_inbox_conversations(days=DEFAULT_DAYS, limit=DEFAULT_LIMIT):
+    """
+    Connect to Microsoft Outlook via COM and read inbox emails grouped by conversation.
+    Only messages received in the last `days` days are read, newest first,
+    up to `limit` messages (None for no limit).
+    Returns a dictionary of conversations.
+    """
+    try:
+        inbox = _get_inbox()
+
+        # Read only the needed columns of mail items through a single table
+        # projection instead of dispatching each property of each message.
+        # Outlook filters to the date window and sorts the table newest first,
+        # so no Python-side filter or sort is needed
+        restriction = f"@SQL=({MAIL_ITEM_FILTER}) AND ({_received_since_filter(days)})"
+        table = inbox.GetTable(restriction)
+        table.Sort("[ReceivedTime]", True)
+        table.Columns.RemoveAll()
+        for column in TABLE_COLUMNS:
+            table.Columns.Add(column)
+
+        # Group in one pass; conversations are created in order of their
+        # latest message, which is the first one seen
+        conversations = {}
+        read_count = 0
+
+        while not table.EndOfTable and (limit is None or read_count < limit):
+            read_count += 1
+            try:
+                row = table.GetNextRow()
+                conv_id, subject, received_time, sender = row.GetValues()
+                subject = subject if subject else "(No Subject)"
+                sender = sender if sender else "Unknown"
+
+                # Group by conversation ID; messages without one are grouped
+                # by subject under a tuple key, which can't collide with an ID
+                group_key = conv_id or (None, subject)
+
+                conversation = conversations.get(group_key)
+                if conversation is None:
+                    conversation = conversations[group_key] = {
+                        'conv_id': conv_id,
+                        'emails': [],
+                        'latest_time': received_time or datetime.min,
+                        'count': 0
+                    }
+
+                conversation['emails'].append({
                     'subject': subject,
                     'sender': sender,
                     'received_time': received_time,
                     'conv_id': conv_id
                 })
+                conversation['count'] += 1
 
             except Exception as e:
                 # Skip messages that cause errors
                 print(f"Warning: Could not read message - {str(e)}")
 
-        # Sort each conversation by received time (oldest first within conversation)
-        for conv_id in conversations:
-            conversations[conv_id].sort(
-                key=lambda x: x['received_time'] if x['received_time'] else datetime.min,
-                reverse=False
-            )
-
-        # Convert to list and sort conversations by most recent message (newest first)
-        conversation_list = []
-        for conv_id, emails in conversations.items():
-            latest_time = max(
-                (email['received_time'] for email in emails if email['received_time']),
-                default=datetime.min
-            )
-            conversation_list.append({
-                'conv_id': conv_id,
-                'emails': emails,
-                'latest_time': latest_time,
-                'count': len(emails)
-            })
-
-        conversation_list.sort(key=lambda x: x['latest_time'], reverse=True)
+        # Table.Sort returns rows newest first, so conversations are already in
+        # order and each one's emails are newest first too - a reverse (not a
+        # sort) lists them oldest first
+        conversation_list = list(conversations.values())
+        for conversation in conversation_list:
+            conversation['emails'].reverse()
 
         return conversation_list
 
     except Exception as e:
+        # The cached handles may be stale (e.g. Outlook was restarted)
+        _reset_outlook()
         print(f"Error accessing Outlook: {e}")
         print("\nMake sure:")
         print("1. Microsoft Outlook is installed")
@@ -86,7 +137,7 @@ def read_outlook_inbox_conversations():
 
 def main():
     """Main function to display inbox emails grouped by conversation"""
-    print("Reading Outlook Inbox (Grouped by Conversation)...\n")
+    print(f"Reading Outlook Inbox (Grouped by Conversation, last {DEFAULT_DAYS} days)...\n")
 
     conversations = read_outlook_inbox_conversations()
 
@@ -4,13 +4,40 @@ Enhanced with comprehensive error handling
 """
 
 import customtkinter as ctk
-from typing import Callable, List, Dict, Optional
+import queue
+from typing import Callable, List, Optional
 from datetime import datetime
 import logging
-import traceback
+
+from models.records import Conversation, Email
 
 logger = logging.getLogger(__name__)
 
+# Interval between checks for status messages from background workers
+STATUS_POLL_MS = 50
+
+# Delay after the last keystroke before a search runs
+SEARCH_DEBOUNCE_MS = 200
+
+# Most recent emails listed on each conversation card
+MAX_EMAIL_ROWS = 3
+
+# Estimated height of a conversation card in pixels, used to size the rendered window
+CARD_HEIGHT_ESTIMATE = 80
+
+# Cards rendered below the bottom of the viewport
+RENDER_OVERSCAN = 10
+
+
+class _ConversationCard:
+    """Widgets of one conversation card"""
+
+    def __init__(self, frame: ctk.CTkFrame, subject_label: ctk.CTkLabel):
+        self.frame = frame
+        self.subject_label = subject_label
+        self.email_labels: List[ctk.CTkLabel] = []
+        self.more_label: Optional[ctk.CTkLabel] = None
+
 
 class MainWindow(ctk.CTk):
     """Main application window with modern design"""
@@ -26,6 +53,12 @@ class MainWindow(ctk.CTk):
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
 
+        # Fonts shared by every conversation card (one Tk font each, not one per widget)
+        self._font_subject_bold = ctk.CTkFont(size=15, weight="bold")
+        self._font_subject = ctk.CTkFont(size=15)
+        self._font_row = ctk.CTkFont(size=12)
+        self._font_more = ctk.CTkFont(size=11)
+
         # Configure grid layout
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(0, weight=1)
@@ -33,6 +66,25 @@ class MainWindow(ctk.CTk):
         # Callbacks (to be set by controller)
         self.on_refresh_callback: Optional[Callable] = None
         self.on_search_callback: Optional[Callable] = None
+        self.on_load_older_callback: Optional[Callable] = None
+        self.on_folder_callback: Optional[Callable] = None
+
+        # Pending debounced search (Tk after id)
+        self._search_after_id = None
+
+        # Status messages posted by background workers (see watch_status_queue)
+        self._status_queue = None
+        self._loading = False
+
+        # Conversation cards, kept and reused across refreshes; the first
+        # _shown_cards of them are currently gridded
+        self._card_pool: List[_ConversationCard] = []
+        self._shown_cards = 0
+        # Full list being displayed; cards are created as the viewport reaches them
+        self._conversations: List[Conversation] = []
+        self._viewport_job = None
+        # Signature of the list last rendered, to skip re-rendering identical content
+        self._last_sig: Optional[tuple] = None
 
         # Create UI components
         self._create_sidebar()
@@ -43,7 +95,7 @@ class MainWindow(ctk.CTk):
         """Create sidebar with controls"""
         self.sidebar = ctk.CTkFrame(self, width=250, corner_radius=0)
         self.sidebar.grid(row=0, column=0, rowspan=2, sticky="nsew")
-        self.sidebar.grid_rowconfigure(6, weight=1)
+        self.sidebar.grid_rowconfigure(7, weight=1)
 
         # App title
         self.logo_label = ctk.CTkLabel(
@@ -85,6 +137,15 @@ class MainWindow(ctk.CTk):
         )
         self.refresh_button.grid(row=4, column=0, padx=20, pady=10, sticky="ew")
 
+        # Load older button
+        self.load_older_button = ctk.CTkButton(
+            self.sidebar,
+            text="⏬ Load Older",
+            command=self._on_load_older_clicked,
+            font=ctk.CTkFont(size=14)
+        )
+        self.load_older_button.grid(row=5, column=0, padx=20, pady=(0, 10), sticky="ew")
+
         # Stats label
         self.stats_label = ctk.CTkLabel(
             self.sidebar,
@@ -92,7 +153,7 @@ class MainWindow(ctk.CTk):
             font=ctk.CTkFont(size=12),
             justify="left"
         )
-        self.stats_label.grid(row=5, column=0, padx=20, pady=10, sticky="w")
+        self.stats_label.grid(row=6, column=0, padx=20, pady=10, sticky="w")
 
         # Appearance mode selector
         self.appearance_label = ctk.CTkLabel(
@@ -100,14 +161,14 @@ class MainWindow(ctk.CTk):
             text="Appearance:",
             font=ctk.CTkFont(size=13)
         )
-        self.appearance_label.grid(row=7, column=0, padx=20, pady=(10, 5), sticky="w")
+        self.appearance_label.grid(row=8, column=0, padx=20, pady=(10, 5), sticky="w")
 
         self.appearance_mode = ctk.CTkOptionMenu(
             self.sidebar,
             values=["Dark", "Light", "System"],
             command=self._change_appearance_mode
         )
-        self.appearance_mode.grid(row=8, column=0, padx=20, pady=(0, 20), sticky="ew")
+        self.appearance_mode.grid(row=9, column=0, padx=20, pady=(0, 20), sticky="ew")
         self.appearance_mode.set("Dark")
 
     def _create_main_area(self):
@@ -125,14 +186,27 @@ class MainWindow(ctk.CTk):
         )
         self.header_label.grid(row=0, column=0, padx=0, pady=(0, 15), sticky="w")
 
+        # Folder selector (folders are set by the controller, see set_folders)
+        self.folder_menu = ctk.CTkOptionMenu(
+            self.main_frame,
+            values=["Inbox"],
+            command=self._on_folder_changed
+        )
+        self.folder_menu.grid(row=0, column=1, padx=0, pady=(0, 15), sticky="e")
+
         # Scrollable frame for conversations
         self.scrollable_frame = ctk.CTkScrollableFrame(
             self.main_frame,
             corner_radius=10
         )
-        self.scrollable_frame.grid(row=1, column=0, sticky="nsew")
+        self.scrollable_frame.grid(row=1, column=0, columnspan=2, sticky="nsew")
         self.scrollable_frame.grid_columnconfigure(0, weight=1)
 
+        # Render more cards whenever the list is scrolled or resized
+        canvas = self.scrollable_frame._parent_canvas
+        canvas.configure(yscrollcommand=self._on_canvas_scrolled)
+        canvas.bind("<Configure>", self._schedule_render_viewport, add="+")
+
         # Initial loading message
         self.loading_label = ctk.CTkLabel(
             self.scrollable_frame,
@@ -160,27 +234,81 @@ class MainWindow(ctk.CTk):
         if self.on_refresh_callback:
             self.on_refresh_callback()
 
+    def _on_load_older_clicked(self):
+        """Handle load older button click"""
+        if self.on_load_older_callback:
+            self.on_load_older_callback()
+
+    def _on_folder_changed(self, folder_name: str):
+        """Handle folder selection"""
+        if self.on_folder_callback:
+            self.on_folder_callback(folder_name)
+
     def _on_search_changed(self, event=None):
-        """Handle search text change"""
+        """Handle search text change, once typing pauses for SEARCH_DEBOUNCE_MS"""
+        self._cancel_pending_search()
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self._run_search)
+
+    def _run_search(self):
+        """Pass the current search text to the controller"""
+        self._search_after_id = None
         if self.on_search_callback:
-            query = self.search_entry.get()
-            self.on_search_callback(query)
+            self.on_search_callback(self.search_entry.get())
+
+    def _cancel_pending_search(self):
+        """Drop a search scheduled by _on_search_changed that hasn't run yet"""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
 
     def _change_appearance_mode(self, mode: str):
         """Change appearance mode (dark/light)"""
         ctk.set_appearance_mode(mode.lower())
+        self._last_sig = None
 
     def set_status(self, message: str):
         """Update status bar message"""
         self.status_label.configure(text=message)
 
+    def set_folders(self, folder_names: List[str], current: str):
+        """Set the folders offered by the folder selector"""
+        self.folder_menu.configure(values=folder_names)
+        self.folder_menu.set(current)
+
+    def watch_status_queue(self, status_queue):
+        """
+        Show progress messages that background workers put on status_queue.
+        The queue is drained every STATUS_POLL_MS; only the latest message of
+        a burst is shown, and only while loading.
+        """
+        self._status_queue = status_queue
+        self.after(STATUS_POLL_MS, self._drain_status)
+
+    def _drain_status(self):
+        """Show the newest pending worker status message, then poll again"""
+        message = None
+        while True:
+            try:
+                message = self._status_queue.get_nowait()
+            except queue.Empty:
+                break
+
+        # Progress arriving after a load finished must not replace its final status
+        if message is not None and self._loading:
+            self.status_label.configure(text=message)
+
+        self.after(STATUS_POLL_MS, self._drain_status)
+
     def set_loading(self, is_loading: bool):
         """Show/hide loading state"""
+        self._loading = is_loading
         if is_loading:
             self.refresh_button.configure(state="disabled", text="Loading...")
+            self.load_older_button.configure(state="disabled")
             self.set_status("Loading conversations...")
         else:
             self.refresh_button.configure(state="normal", text="🔄 Refresh Inbox")
+            self.load_older_button.configure(state="normal")
 
     def update_stats(self, total_emails: int, total_conversations: int):
         """Update statistics display"""
@@ -193,8 +321,8 @@ class MainWindow(ctk.CTk):
         except Exception as e:
             logger.error(f"Error updating stats: {e}")
 
-    def display_conversations(self, conversations: List[Dict]):
-        """Display conversations in the main area with comprehensive error handling"""
+    def display_conversations(self, conversations: List[Conversation]):
+        """Display conversations in the main area, reusing the cards already created"""
         logger.info(f"Displaying {len(conversations) if conversations else 0} conversations")
 
         try:
@@ -207,224 +335,208 @@ class MainWindow(ctk.CTk):
                 logger.error(f"Invalid conversations type: {type(conversations)}")
                 conversations = []
 
-            # Clear existing content
-            logger.debug("Clearing existing widgets...")
-            try:
-                for widget in self.scrollable_frame.winfo_children():
-                    widget.destroy()
-            except Exception as e:
-                logger.error(f"Error clearing widgets: {e}")
+            # Nothing to do if the same content is already displayed
+            sig = self._render_signature(conversations)
+            if sig == self._last_sig:
+                logger.debug("Conversations unchanged - skipping render")
+                return
+            self._last_sig = None
+
+            self.loading_label.grid_remove()
+            self._conversations = conversations
+            self.scrollable_frame._parent_canvas.yview_moveto(0)
 
             # Handle empty conversations
-            if not conversations or len(conversations) == 0:
+            if not conversations:
                 logger.info("No conversations to display")
-                try:
-                    empty_label = ctk.CTkLabel(
-                        self.scrollable_frame,
-                        text="No conversations found",
-                        font=ctk.CTkFont(size=14),
-                        text_color="gray"
-                    )
-                    empty_label.grid(row=0, column=0, pady=100)
-                except Exception as e:
-                    logger.error(f"Error creating empty label: {e}")
+                self._hide_cards_from(0)
+                self._show_message("No conversations found", "gray")
+                self._last_sig = sig
                 return
 
-            # Display each conversation
-            displayed_count = 0
-            error_count = 0
-
-            for i, conv in enumerate(conversations):
-                try:
-                    if not isinstance(conv, dict):
-                        logger.warning(f"Skipping invalid conversation at index {i}: not a dict")
-                        error_count += 1
-                        continue
-
-                    self._create_conversation_card(conv, i)
-                    displayed_count += 1
-
-                except Exception as e:
-                    error_count += 1
-                    logger.error(f"Error creating conversation card {i}: {e}")
-                    logger.debug(f"Card creation error traceback: {traceback.format_exc()}")
-                    continue
-
-            logger.info(f"Displayed {displayed_count} conversations successfully ({error_count} errors)")
+            # Display the conversations that fit the viewport, then hide cards
+            # left over from a longer list; the rest are shown on scroll
+            window = min(len(conversations), self._visible_count() + RENDER_OVERSCAN)
+            displayed_count = self.append_conversations(conversations[:window])
+            self._hide_cards_from(window)
 
             # If all conversations failed to display, show error
-            if displayed_count == 0 and len(conversations) > 0:
+            if displayed_count == 0:
                 logger.error("Failed to display any conversations")
-                try:
-                    error_label = ctk.CTkLabel(
-                        self.scrollable_frame,
-                        text="Error displaying conversations\nCheck log file for details",
-                        font=ctk.CTkFont(size=14),
-                        text_color="red"
-                    )
-                    error_label.grid(row=0, column=0, pady=100)
-                except Exception as e:
-                    logger.error(f"Error creating error label: {e}")
+                self._show_message("Error displaying conversations\nCheck log file for details", "red")
+            else:
+                self._last_sig = sig
 
-        except Exception as e:
-            logger.error(f"Critical error in display_conversations: {e}")
-            logger.debug(f"Display error traceback: {traceback.format_exc()}")
+        except Exception:
+            logger.exception("Critical error in display_conversations")
             try:
-                error_label = ctk.CTkLabel(
-                    self.scrollable_frame,
-                    text="Critical error displaying conversations",
-                    font=ctk.CTkFont(size=14),
-                    text_color="red"
-                )
-                error_label.grid(row=0, column=0, pady=100)
+                self._hide_cards_from(0)
+                self._show_message("Critical error displaying conversations", "red")
             except:
                 pass
 
-    def _create_conversation_card(self, conv: Dict, row: int):
-        """Create a card for a single conversation with error handling"""
-        try:
-            # Validate conversation data
-            if not conv:
-                logger.error("Empty conversation data")
-                return
+    @staticmethod
+    def _render_signature(conversations: List[Conversation]) -> tuple:
+        """Everything a card shows, per conversation, in display order"""
+        return tuple(
+            (
+                conv.conv_id, conv.count, conv.latest_time, conv.has_unread, conv.subject,
+                tuple(email.entry_id for email in conv.emails[-MAX_EMAIL_ROWS:]),
+                tuple(email.unread for email in conv.emails[-MAX_EMAIL_ROWS:])
+            )
+            for conv in conversations
+        )
 
-            # Get count with validation
-            count = conv.get('count', 0)
-            if not isinstance(count, int) or count < 0:
-                logger.warning(f"Invalid count: {count}, defaulting to 0")
-                count = 0
+    def append_conversations(self, conversations: List[Conversation], start_row: int = 0) -> int:
+        """
+        Show conversations below those already displayed, from row start_row.
+        Returns the number of cards shown.
+        """
+        displayed_count = 0
+        error_count = 0
+
+        # One guard per card: widget updates don't fail for valid records, and
+        # a card that does fail is hidden rather than left half-updated
+        for i, conv in enumerate(conversations, start_row):
+            try:
+                self._update_conversation_card(self._get_card(i), conv, i)
+                displayed_count += 1
+            except Exception:
+                error_count += 1
+                logger.exception(f"Error rendering conversation card {i}")
+                if i < len(self._card_pool):
+                    self._card_pool[i].frame.grid_remove()
+
+        self._shown_cards = max(self._shown_cards, start_row + len(conversations))
+
+        logger.info(f"Displayed {displayed_count} conversations successfully ({error_count} errors)")
+        return displayed_count
+
+    def _on_canvas_scrolled(self, first: str, last: str):
+        """Update the scrollbar for a new scroll position and render cards coming into view"""
+        self.scrollable_frame._scrollbar.set(first, last)
+        self._schedule_render_viewport()
+
+    def _schedule_render_viewport(self, event=None):
+        """Render the viewport once the current burst of scroll/resize events is handled"""
+        if self._viewport_job is None:
+            self._viewport_job = self.after_idle(self._render_viewport)
+
+    def _render_viewport(self):
+        """Create cards down to the bottom of the viewport plus RENDER_OVERSCAN"""
+        self._viewport_job = None
+        total = len(self._conversations)
+        if self._shown_cards >= total:
+            return
 
-            # Determine if conversation has multiple emails
-            is_multi = count > 1
-            has_unread = conv.get('has_unread', False)
+        try:
+            first_visible = int(self.scrollable_frame._parent_canvas.yview()[0] * self._shown_cards)
+            last_needed = min(total, first_visible + self._visible_count() + RENDER_OVERSCAN)
+            if last_needed > self._shown_cards:
+                start = self._shown_cards
+                self.append_conversations(self._conversations[start:last_needed], start)
+        except Exception as e:
+            logger.error(f"Error rendering visible conversations: {e}")
 
-            # Get subject with validation
-            subject = conv.get('subject', "(No Subject)")
-            if not subject or not isinstance(subject, str):
-                subject = "(No Subject)"
+    def _visible_count(self) -> int:
+        """Estimated number of cards that fit in the viewport"""
+        height = max(self.scrollable_frame._parent_canvas.winfo_height(), self.winfo_height())
+        return height // CARD_HEIGHT_ESTIMATE + 1
 
-            # Create card frame
-            try:
-                # Build frame parameters
-                frame_params = {
-                    'master': self.scrollable_frame,
-                    'corner_radius': 10,
-                }
-
-                # Add border only for unread conversations
-                if has_unread:
-                    frame_params['border_width'] = 2
-                    frame_params['border_color'] = "#1f6aa5"
-
-                card = ctk.CTkFrame(**frame_params)
-                card.grid(row=row, column=0, sticky="ew", padx=5, pady=5)
-                card.grid_columnconfigure(0, weight=1)
-            except Exception as e:
-                logger.error(f"Error creating card frame: {e}")
-                return
+    def _show_message(self, text: str, color: str):
+        """Show a message in place of the conversation list"""
+        self.loading_label.configure(text=text, text_color=color)
+        self.loading_label.grid(row=0, column=0, pady=100)
 
-            # Build subject text
-            subject_text = subject
-            if has_unread:
-                subject_text = f"🔵 {subject_text}"
-            if is_multi:
-                subject_text = f"💬 {subject_text} ({count} messages)"
+    def _hide_cards_from(self, index: int):
+        """Hide pooled cards from index on (they are kept for reuse, not destroyed)"""
+        for card in self._card_pool[index:self._shown_cards]:
+            card.frame.grid_remove()
+        self._shown_cards = min(self._shown_cards, index)
+
+    def _get_card(self, index: int) -> "_ConversationCard":
+        """Return the pooled card at index, creating cards as the pool grows"""
+        while len(self._card_pool) <= index:
+            frame = ctk.CTkFrame(
+                self.scrollable_frame,
+                corner_radius=10,
+                border_width=0,
+                border_color="#1f6aa5"
+            )
+            frame.grid_columnconfigure(0, weight=1)
+
+            subject_label = ctk.CTkLabel(frame, text="", anchor="w")
+            subject_label.grid(row=0, column=0, sticky="w", padx=15, pady=(12, 5))
+
+            self._card_pool.append(_ConversationCard(frame, subject_label))
+
+        return self._card_pool[index]
+
+    def _update_conversation_card(self, card: "_ConversationCard", conv: Conversation, row: int):
+        """Fill a card with a conversation and show it at the given row"""
+        count = conv.count
+        is_multi = count > 1
+        has_unread = conv.has_unread
+        subject = conv.subject or "(No Subject)"
+
+        # Border only for unread conversations
+        card.frame.configure(border_width=2 if has_unread else 0)
+        card.frame.grid(row=row, column=0, sticky="ew", padx=5, pady=5)
+
+        # Build subject text in one join, e.g. "💬 🔵 Subject (3 messages)"
+        parts = []
+        if is_multi:
+            parts.append("💬 ")
+        if has_unread:
+            parts.append("🔵 ")
+        parts.append(subject)
+        if is_multi:
+            parts.append(f" ({count} messages)")
+        subject_text = "".join(parts)
+
+        card.subject_label.configure(
+            text=subject_text,
+            font=self._font_subject_bold if has_unread else self._font_subject
+        )
 
-            # Create subject label
-            try:
-                subject_label = ctk.CTkLabel(
-                    card,
-                    text=subject_text,
-                    font=ctk.CTkFont(size=15, weight="bold" if has_unread else "normal"),
-                    anchor="w"
+        # Show last 3 emails; hide the rows this conversation doesn't need
+        recent_emails = conv.emails[-MAX_EMAIL_ROWS:]
+        for j, email in enumerate(recent_emails):
+            if j == len(card.email_labels):
+                card.email_labels.append(self._create_email_row(card.frame))
+            self._update_email_row(card.email_labels[j], email, j + 1)
+        for label in card.email_labels[len(recent_emails):]:
+            label.grid_remove()
+
+        # If more than 3 emails, show indicator
+        if count > MAX_EMAIL_ROWS:
+            if card.more_label is None:
+                card.more_label = ctk.CTkLabel(
+                    card.frame,
+                    text="",
+                    font=self._font_more,
+                    text_color="gray"
                 )
-                subject_label.grid(row=0, column=0, sticky="w", padx=15, pady=(12, 5))
-            except Exception as e:
-                logger.error(f"Error creating subject label: {e}")
-
-            # Get emails list
-            emails = conv.get('emails', [])
-            if not isinstance(emails, list):
-                logger.warning(f"Invalid emails type: {type(emails)}")
-                emails = []
-
-            # Display emails in conversation
-            if emails:
-                # Show last 3 emails
-                recent_emails = emails[-3:] if len(emails) > 3 else emails
-                for j, email in enumerate(recent_emails):
-                    try:
-                        if isinstance(email, dict):
-                            self._create_email_row(card, email, j + 1, len(emails) > 3 and j == 0)
-                        else:
-                            logger.warning(f"Skipping invalid email at index {j}")
-                    except Exception as e:
-                        logger.error(f"Error creating email row {j}: {e}")
-
-            # If more than 3 emails, show indicator
-            if count > 3:
-                try:
-                    more_label = ctk.CTkLabel(
-                        card,
-                        text=f"... and {count - 3} more message(s)",
-                        font=ctk.CTkFont(size=11),
-                        text_color="gray"
-                    )
-                    more_label.grid(row=100, column=0, sticky="w", padx=15, pady=(0, 10))
-                except Exception as e:
-                    logger.error(f"Error creating 'more' label: {e}")
+            card.more_label.configure(text=f"... and {count - MAX_EMAIL_ROWS} more message(s)")
+            card.more_label.grid(row=100, column=0, sticky="w", padx=15, pady=(0, 10))
+        elif card.more_label is not None:
+            card.more_label.grid_remove()
 
-        except Exception as e:
-            logger.error(f"Error in _create_conversation_card: {e}")
-            logger.debug(f"Conversation card error traceback: {traceback.format_exc()}")
+    def _create_email_row(self, parent) -> ctk.CTkLabel:
+        """Create the label for an email row within a conversation card"""
+        return ctk.CTkLabel(parent, text="", font=self._font_row, anchor="w")
 
-    def _create_email_row(self, parent, email: Dict, row: int, show_ellipsis: bool):
-        """Create a row for a single email within a conversation with error handling"""
-        try:
-            # Validate email data
-            if not email or not isinstance(email, dict):
-                logger.warning("Invalid email data")
-                return
+    def _update_email_row(self, label: ctk.CTkLabel, email: Email, row: int):
+        """Fill an email row label and show it at the given row of its card"""
+        received_time = email.received_time
+        time_str = received_time.strftime("%b %d, %Y %I:%M %p") if received_time else "Unknown date"
+        sender = email.sender or 'Unknown'
+        unread = email.unread
 
-            # Format timestamp safely
-            received_time = email.get('received_time')
-            try:
-                if received_time and hasattr(received_time, 'strftime'):
-                    time_str = received_time.strftime("%b %d, %Y %I:%M %p")
-                else:
-                    time_str = "Unknown date"
-            except Exception as e:
-                logger.warning(f"Error formatting timestamp: {e}")
-                time_str = "Unknown date"
-
-            # Get sender safely
-            sender = email.get('sender', 'Unknown')
-            if not sender or not isinstance(sender, str):
-                sender = 'Unknown'
-
-            # Get unread status
-            unread = email.get('unread', False)
-
-            # Create info text
-            unread_indicator = "🔵 " if unread else ""
-            info_text = f"{unread_indicator}{sender} • {time_str}"
-
-            # Create label
-            try:
-                info_label = ctk.CTkLabel(
-                    parent,
-                    text=info_text,
-                    font=ctk.CTkFont(size=12),
-                    anchor="w",
-                    text_color="lightblue" if unread else "gray"
-                )
-                info_label.grid(row=row, column=0, sticky="w", padx=35, pady=2)
-            except Exception as e:
-                logger.error(f"Error creating email info label: {e}")
+        info_text = f"🔵 {sender} • {time_str}" if unread else f"{sender} • {time_str}"
 
-        except Exception as e:
-            logger.error(f"Error in _create_email_row: {e}")
-            logger.debug(f"Email row error traceback: {traceback.format_exc()}")
+        label.configure(text=info_text, text_color="lightblue" if unread else "gray")
+        label.grid(row=row, column=0, sticky="w", padx=35, pady=2)
 
     def show_error(self, title: str, message: str):
         """Show error dialog"""
@@ -467,4 +579,5 @@ class MainWindow(ctk.CTk):
 
     def clear_search(self):
         """Clear search box"""
+        self._cancel_pending_search()
         self.search_entry.delete(0, "end")